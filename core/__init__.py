@@ -1,30 +1,41 @@
-from core.scanner import ScanThread
-from core.permission_fixer import PermissionFixer, PermissionBackup
-from core.integrity import IntegrityManager
-from core.database import init_database, log_scan, log_permission_change
-from core.security import SecurityManager
-from core.encryption_manager import EncryptionWorker
-from core.backup import BackupManager, PermissionMetadata, RestoreManager
-from core.secure_memory import SecureString, secure_delete_file
-from core.pipeline import PermissionPipeline, PipelineStep, PipelineResult, run_permission_pipeline
+import importlib
 
-__all__ = [
-    'ScanThread',
-    'PermissionFixer',
-    'PermissionBackup',
-    'IntegrityManager',
-    'SecurityManager',
-    'EncryptionWorker',
-    'SecureString',
-    'secure_delete_file',
-    'BackupManager',
-    'PermissionMetadata',
-    'RestoreManager',
-    'PermissionPipeline',
-    'PipelineStep',
-    'PipelineResult',
-    'run_permission_pipeline',
-    'init_database',
-    'log_scan',
-    'log_permission_change',
-]
+# Re-export malas (PEP 562): init_database dkk. bisa diimpor tanpa menarik PyQt6.
+_LAZY = {
+    'ScanThread': 'core.scanner',
+    'ScanResults': 'core.scanner',
+    'PermissionFixer': 'core.permission_fixer',
+    'PermissionBackup': 'core.permission_fixer',
+    'IntegrityManager': 'core.integrity',
+    'SecurityManager': 'core.security',
+    'EncryptionWorker': 'core.encryption_manager',
+    'SecureString': 'core.secure_memory',
+    'secure_delete_file': 'core.secure_memory',
+    'BackupManager': 'core.backup',
+    'PermissionMetadata': 'core.backup',
+    'RestoreManager': 'core.backup',
+    'PermissionPipeline': 'core.pipeline',
+    'PipelineStep': 'core.pipeline',
+    'PipelineResult': 'core.pipeline',
+    'run_permission_pipeline': 'core.pipeline',
+    'init_database': 'core.database',
+    'log_scan': 'core.database',
+    'log_scan_in_background': 'core.database',
+    'log_permission_change': 'core.database',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,59 @@
 import sqlite3
 import os
+import threading
 from datetime import datetime
 
+from utils.helpers import format_mode
+
+DB_PATH = 'scan_logs.db'
+
+# Hasil per file hanya disimpan untuk sejumlah scan terakhir; ringkasan scan_logs tetap utuh.
+SCAN_FILES_KEEP_SCANS = 5
+
+# Statement INSERT dipakai ulang; sqlite3 menyimpan hasil prepare per teks SQL di cache koneksi.
+_INSERT_SCAN_LOG = '''
+    INSERT INTO scan_logs 
+    (scan_date, folder_path, total_files, total_size, high_risk, medium_risk, low_risk, duration)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_SCAN_FILE = '''
+    INSERT INTO scan_files (scan_id, file_path, mode, risk, size, modified)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_PRUNE_SCAN_FILES = '''
+    DELETE FROM scan_files
+    WHERE scan_id NOT IN (SELECT id FROM scan_logs ORDER BY id DESC LIMIT ?)
+'''
+
+_INSERT_ENCRYPTION_LOG = '''
+    INSERT INTO encryption_logs 
+    (timestamp, operation, file_path, file_size, status, hash, error_message, duration)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_BACKUP_LOG = '''
+    INSERT INTO backup_logs 
+    (timestamp, backup_name, file_count, total_size, backup_path, status, description, duration)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_PERMISSION_CHANGE = '''
+    INSERT INTO permission_changes 
+    (timestamp, file_path, old_permission, new_permission, operation, user, success)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
 def init_database():
     try:
-        conn = sqlite3.connect('scan_logs.db', timeout=10)
+        conn = sqlite3.connect(DB_PATH, timeout=10)
         cursor = conn.cursor()
         
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
         cursor.execute("PRAGMA foreign_keys=ON")
         
         cursor.execute('''
@@ -27,6 +72,18 @@ def init_database():
             )
         ''')
         
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scan_id INTEGER REFERENCES scan_logs(id) ON DELETE CASCADE,
+                file_path TEXT,
+                mode TEXT,
+                risk TEXT,
+                size INTEGER,
+                modified DATETIME
+            )
+        ''')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS encryption_logs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -72,15 +129,16 @@ def init_database():
         ''')
         
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_scan_date ON scan_logs(scan_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_scan_files_scan ON scan_files(scan_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_encryption_timestamp ON encryption_logs(timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_backup_timestamp ON backup_logs(timestamp)')
         
         conn.commit()
         
         try:
-            os.chmod('scan_logs.db', 0o600)
+            os.chmod(DB_PATH, 0o600)
             for ext in ['-wal', '-shm']:
-                wal_file = f'scan_logs.db{ext}'
+                wal_file = f'{DB_PATH}{ext}'
                 if os.path.exists(wal_file):
                     os.chmod(wal_file, 0o600)
         except:
@@ -92,90 +150,96 @@ def init_database():
         print(f"Database initialization error: {e}")
         return sqlite3.connect(':memory:')
 
-def log_scan(conn, scan_data: dict):
+def log_scan(conn, scan_data: dict, files: list = None):
+    """Simpan ringkasan scan dan (opsional) hasil per file dalam satu transaksi."""
     try:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO scan_logs 
-            (scan_date, folder_path, total_files, total_size, high_risk, medium_risk, low_risk, duration)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            datetime.now(),
-            scan_data.get('folder_path', ''),
-            scan_data.get('total_files', 0),
-            scan_data.get('total_size', 0),
-            scan_data.get('high_risk', 0),
-            scan_data.get('medium_risk', 0),
-            scan_data.get('low_risk', 0),
-            scan_data.get('duration', 0)
-        ))
-        conn.commit()
+        with conn:
+            cursor = conn.execute(_INSERT_SCAN_LOG, (
+                datetime.now(),
+                scan_data.get('folder_path', ''),
+                scan_data.get('total_files', 0),
+                scan_data.get('total_size', 0),
+                scan_data.get('high_risk', 0),
+                scan_data.get('medium_risk', 0),
+                scan_data.get('low_risk', 0),
+                scan_data.get('duration', 0)
+            ))
+            
+            if files:
+                scan_id = cursor.lastrowid
+                conn.executemany(_INSERT_SCAN_FILE, (
+                    (scan_id, f['path'], format_mode(f['info']['st_mode']), f['risk'],
+                     f['info']['size'], datetime.fromtimestamp(f['info']['mtime'])) for f in files))
+                conn.execute(_PRUNE_SCAN_FILES, (SCAN_FILES_KEEP_SCANS,))
         return True
     except Exception as e:
         print(f"Database error: {e}")
         return False
 
+def log_scan_in_background(scan_data: dict, files=None, db_path: str = DB_PATH) -> threading.Thread:
+    """
+    Jalankan log_scan di thread sendiri agar insert per file tidak memblokir GUI.
+    
+    Koneksi sqlite tidak dibagi antar thread, jadi thread ini membuka koneksinya
+    sendiri. files tidak boleh diubah selama thread berjalan.
+    """
+    def write():
+        conn = sqlite3.connect(db_path, timeout=10)
+        try:
+            log_scan(conn, scan_data, files)
+        finally:
+            conn.close()
+    
+    thread = threading.Thread(target=write, name='ScanLogWriter')
+    thread.start()
+    return thread
+
 def log_encryption(conn, encryption_data: dict):
     try:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO encryption_logs 
-            (timestamp, operation, file_path, file_size, status, hash, error_message, duration)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            datetime.now(),
-            encryption_data.get('operation', ''),
-            encryption_data.get('file_path', ''),
-            encryption_data.get('file_size', 0),
-            encryption_data.get('status', ''),
-            encryption_data.get('hash', ''),
-            encryption_data.get('error_message', ''),
-            encryption_data.get('duration', 0)
-        ))
-        conn.commit()
+        with conn:
+            conn.execute(_INSERT_ENCRYPTION_LOG, (
+                datetime.now(),
+                encryption_data.get('operation', ''),
+                encryption_data.get('file_path', ''),
+                encryption_data.get('file_size', 0),
+                encryption_data.get('status', ''),
+                encryption_data.get('hash', ''),
+                encryption_data.get('error_message', ''),
+                encryption_data.get('duration', 0)
+            ))
         return True
     except:
         return False
 
 def log_backup(conn, backup_data: dict):
     try:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO backup_logs 
-            (timestamp, backup_name, file_count, total_size, backup_path, status, description, duration)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            datetime.now(),
-            backup_data.get('backup_name', ''),
-            backup_data.get('file_count', 0),
-            backup_data.get('total_size', 0),
-            backup_data.get('backup_path', ''),
-            backup_data.get('status', ''),
-            backup_data.get('description', ''),
-            backup_data.get('duration', 0)
-        ))
-        conn.commit()
+        with conn:
+            conn.execute(_INSERT_BACKUP_LOG, (
+                datetime.now(),
+                backup_data.get('backup_name', ''),
+                backup_data.get('file_count', 0),
+                backup_data.get('total_size', 0),
+                backup_data.get('backup_path', ''),
+                backup_data.get('status', ''),
+                backup_data.get('description', ''),
+                backup_data.get('duration', 0)
+            ))
         return True
     except:
         return False
 
 def log_permission_change(conn, change_data: dict):
     try:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO permission_changes 
-            (timestamp, file_path, old_permission, new_permission, operation, user, success)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            datetime.now(),
-            change_data.get('file_path', ''),
-            change_data.get('old_permission', ''),
-            change_data.get('new_permission', ''),
-            change_data.get('operation', ''),
-            change_data.get('user', ''),
-            change_data.get('success', False)
-        ))
-        conn.commit()
+        with conn:
+            conn.execute(_INSERT_PERMISSION_CHANGE, (
+                datetime.now(),
+                change_data.get('file_path', ''),
+                change_data.get('old_permission', ''),
+                change_data.get('new_permission', ''),
+                change_data.get('operation', ''),
+                change_data.get('user', ''),
+                change_data.get('success', False)
+            ))
         return True
     except:
         return False
@@ -221,3 +285,8 @@ def get_statistics(conn):
         }
     except:
         return {}
+
+if __name__ == '__main__':
+    # Inisialisasi/migrasi skema tanpa membuka GUI: python -m core.database
+    init_database().close()
+    print(f"Database initialized: {DB_PATH}")
@@ -13,10 +13,11 @@ r"""╔════════════════════════
 import os
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
 
-from core.security import SecurityManager
+from core.security import SecurityManager, InvalidPasswordError, DecryptionError, DecryptionRateLimitError
 from core.secure_memory import SecureString, secure_delete_file
 from core.integrity import IntegrityManager
 
@@ -34,14 +35,20 @@ class EncryptionWorker(QObject):
         self.security_manager = SecurityManager()
         self.integrity_manager = IntegrityManager()
         self._is_cancelled = False
+        # salt -> Future dari _warm_key; file itu menunggu future ini alih-alih menjalankan KDF lagi.
+        self._prefetched = {}
         
     def run(self):
         total = len(self.files)
         success_count = 0
+        kdf_pool = ThreadPoolExecutor(max_workers=1) if self.mode != 'encrypt' and total > 1 else None
         
         for i, filepath in enumerate(self.files):
             if self._is_cancelled:
                 break
+            
+            if kdf_pool is not None and i + 1 < total:
+                self._prefetch_key(kdf_pool, self.files[i + 1])
                 
             try:
                 self.progress.emit(int((i / total) * 100), f"Processing {os.path.basename(filepath)}...")
@@ -56,7 +63,42 @@ class EncryptionWorker(QObject):
             except Exception as e:
                 self.error.emit(f"Error processing {filepath}: {str(e)}")
         
+        if kdf_pool is not None:
+            kdf_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetched.clear()
         self.finished.emit()
+    
+    def _prefetch_key(self, kdf_pool: ThreadPoolExecutor, filepath: str):
+        """
+        Turunkan kunci file berikutnya di background selagi file ini diproses.
+        
+        KDF melepas GIL, dan hasilnya masuk cache kunci SecurityManager.
+        Pada format 0x05 verifikasi sandi sudah berupa KDF, jadi verifikasi
+        ikut dijalankan di background; kunci hanya diturunkan jika cocok.
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                salt = f.read(16)
+                verification_hash = f.read(32)
+                version = f.read(1)
+            if len(salt) == 16 and salt not in self._prefetched:
+                self._prefetched[salt] = kdf_pool.submit(self._warm_key, salt, verification_hash, version)
+        except OSError:
+            pass
+    
+    def _warm_key(self, salt: bytes, verification_hash: bytes, version: bytes):
+        # verify_password hanya meng-cache material KDF jika sandi cocok.
+        if self.security_manager.verify_password(self.password, salt, verification_hash, version):
+            self.security_manager.derive_raw_key(self.password, salt, version)
+    
+    def _await_prefetch(self, salt: bytes):
+        """Tunggu prefetch untuk salt ini (jika ada) agar KDF yang sama tidak berjalan dua kali."""
+        future = self._prefetched.pop(salt, None)
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass
         
     def cancel(self):
         self._is_cancelled = True
@@ -69,8 +111,10 @@ class EncryptionWorker(QObject):
         File asli dipindahkan ke folder .quarantine/ (TIDAK dihapus).
         
         Format file: [garam (16 byte)] [verifikasi_hash (32 byte)] [data_terenkripsi]
+        dengan data_terenkripsi = [versi] [nonce (12 byte)] [ciphertext AES-GCM + tag].
+        File lama berisi token Fernet dan tetap dapat didekripsi.
         
-        Catatan: Fernet tidak mendukung enkripsi streaming yang sebenarnya, begitu pula file
+        Catatan: enkripsi dilakukan sekali jalan, bukan streaming, sehingga file
         dimuat ke dalam memori. File besar (>100MB) akan menampilkan peringatan.
         """
         CHUNK_SIZE = 64 * 1024
@@ -189,8 +233,6 @@ class EncryptionWorker(QObject):
             InvalidPasswordError: Jika kata sandi salah
             DecryptionError: Jika dekripsi gagal
         """
-        from core.security import InvalidPasswordError, DecryptionError, DecryptionRateLimitError
-        
         try:
             if not filepath.endswith('.enc'):
                 self.error.emit(f"File {os.path.basename(filepath)} bukan file terenkripsi (.enc)")
@@ -207,6 +249,8 @@ class EncryptionWorker(QObject):
                     encrypted_data = f.read()
                 verification_hash = None
             
+            self._await_prefetch(salt)
+            
             try:
                 decrypted_data = self.security_manager.decrypt_data(
                     encrypted_data, 
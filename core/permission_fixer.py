@@ -3,7 +3,14 @@ import stat
 import json
 from datetime import datetime
 from typing import List, Tuple, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
+
+_HAS_DIR_FD = (os.chmod in os.supports_dir_fd and os.stat in os.supports_dir_fd
+               and hasattr(os, 'O_DIRECTORY'))
+
+# Sengaja lebih sempit dari utils.constants.EXECUTABLE_EXTENSIONS (tanpa .bat/.cmd/.ps1/
+# .bash/appimage): ini daftar asli fixer, jadi izin yang disarankan tidak berubah.
+_FIXER_EXEC_SUFFIXES = ('.sh', '.py', '.exe', '.bin', '.run', '.app')
 
 
 class PermissionBackup:
@@ -253,8 +260,7 @@ class PermissionFixer:
         if os.access(filepath, os.X_OK):
             return 0o755
         
-        executable_extensions = ['.sh', '.py', '.exe', '.bin', '.run', '.app']
-        if any(filepath.endswith(ext) for ext in executable_extensions):
+        if filepath.endswith(_FIXER_EXEC_SUFFIXES):
             return 0o755
         
         try:
@@ -357,68 +363,96 @@ class PermissionFixer:
             except Exception as e:
                 results['errors'].append(f"Backup failed: {str(e)}")
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
-            for filepath in all_paths:
-                if not os.path.exists(filepath):
-                    continue
-                
-                if custom_mode is not None:
-                    if os.path.isdir(filepath) and (custom_mode & 0o400):
-                        new_mode = custom_mode | 0o100
-                    else:
-                        new_mode = custom_mode
+        # Dikelompokkan per direktori induk: fd direktori dibuka, dipakai, lalu langsung ditutup.
+        by_dir: Dict[str, List[Tuple[str, int, bool]]] = {}
+        for filepath in all_paths:
+            if not os.path.exists(filepath):
+                continue
+
+            if custom_mode is not None:
+                if os.path.isdir(filepath) and (custom_mode & 0o400):
+                    new_mode = custom_mode | 0o100
                 else:
-                    new_mode = PermissionFixer.determine_appropriate_permission(filepath)
-                
-                is_dir = os.path.isdir(filepath)
-                
-                future = executor.submit(
-                    self._fix_single_permission,
-                    filepath, new_mode, is_dir
-                )
-                futures.append((filepath, future))
-            
-            for i, (filepath, future) in enumerate(futures):
+                    new_mode = custom_mode
+            else:
+                new_mode = PermissionFixer.determine_appropriate_permission(filepath)
+
+            is_dir = os.path.isdir(filepath)
+            by_dir.setdefault(os.path.dirname(filepath), []).append((filepath, new_mode, is_dir))
+
+        total = sum(len(entries) for entries in by_dir.values())
+        done = 0
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for directory, entries in by_dir.items():
+                dir_fd = self._open_dir_fd(directory)
+                futures = [
+                    (filepath, executor.submit(self._fix_single_permission, filepath, new_mode, is_dir, dir_fd))
+                    for filepath, new_mode, is_dir in entries
+                ]
                 try:
-                    success, message = future.result(timeout=10)
-                    
-                    if success:
-                        results['success'] += 1
-                    else:
-                        results['failed'] += 1
-                        results['errors'].append(f"{os.path.basename(filepath)}: {message}")
-                    
-                    results['details'].append({
-                        'file': filepath,
-                        'success': success,
-                        'message': message
-                    })
-                    
-                    if progress_callback:
-                        progress_callback(int((i + 1) / len(futures) * 100))
-                        
-                except Exception as e:
-                    results['failed'] += 1
-                    results['errors'].append(f"{os.path.basename(filepath)}: {str(e)}")
-        
+                    for filepath, future in futures:
+                        try:
+                            success, message = future.result(timeout=10)
+
+                            if success:
+                                results['success'] += 1
+                            else:
+                                results['failed'] += 1
+                                results['errors'].append(f"{os.path.basename(filepath)}: {message}")
+
+                            results['details'].append({
+                                'file': filepath,
+                                'success': success,
+                                'message': message
+                            })
+
+                        except Exception as e:
+                            results['failed'] += 1
+                            results['errors'].append(f"{os.path.basename(filepath)}: {str(e)}")
+
+                        done += 1
+                        if progress_callback:
+                            progress_callback(int(done / total * 100))
+                finally:
+                    if dir_fd is not None:
+                        # Tunggu task yang masih berjalan (mis. setelah timeout) sebelum fd ditutup.
+                        wait([future for _, future in futures])
+                        os.close(dir_fd)
+
         return results
     
     @staticmethod
-    def _fix_single_permission(filepath: str, new_mode: int, is_dir: bool = False) -> Tuple[bool, str]:
-        """Internal method to fix permission without backup (for batch operations)."""
+    def _open_dir_fd(directory: str) -> Optional[int]:
+        """O_DIRECTORY fd untuk directory; None jika tidak didukung atau gagal dibuka."""
+        if not _HAS_DIR_FD:
+            return None
+        try:
+            return os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _fix_single_permission(filepath: str, new_mode: int, is_dir: bool = False,
+                               dir_fd: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Internal method to fix permission without backup (for batch operations).
+        
+        With dir_fd the basename is resolved relative to the open parent
+        directory, so the kernel does not re-walk the whole path per call.
+        """
+        target = os.path.basename(filepath) if dir_fd is not None else filepath
         try:
             if new_mode < 0 or new_mode > 0o777:
                 return False, "Mode izin tidak valid"
             
-            if not os.path.exists(filepath):
+            try:
+                current_mode = os.stat(target, dir_fd=dir_fd).st_mode & 0o777
+            except FileNotFoundError:
                 return False, "File tidak ditemukan"
             
-            current_mode = os.stat(filepath).st_mode & 0o777
+            os.chmod(target, new_mode, dir_fd=dir_fd)
             
-            os.chmod(filepath, new_mode)
-            
-            verify_mode = os.stat(filepath).st_mode & 0o777
+            verify_mode = os.stat(target, dir_fd=dir_fd).st_mode & 0o777
             if verify_mode != new_mode:
                 return False, f"Gagal mengatur izin (diharapkan {oct(new_mode)}, didapat {oct(verify_mode)})"
             
@@ -11,134 +11,267 @@ r"""╔════════════════════════
 ╚══════════════════════════════════════════════════════════════════╝"""
 
 import os
-import stat
+import re
+from array import array
 from datetime import datetime
-from typing import Dict, Optional, List
+import functools
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Optional, List, Iterable, Iterator, Tuple
 from PyQt6.QtCore import QThread, pyqtSignal, QMutex
 
-class ScanThread(QThread):
-    progress = pyqtSignal(int, str)
-    file_found = pyqtSignal(dict)
-    stats_update = pyqtSignal(dict)
-    finished = pyqtSignal(list, dict)
-    error = pyqtSignal(str, str)
+PRUNE_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'target', 'build', 'dist', '.tox', '.mypy_cache', '.pytest_cache',
+    '.idea', '.vscode',
+})
+
+# Progress dikirim tiap 64 file, terhadap max_files sebagai perkiraan total.
+PROGRESS_MASK = 64 - 1
+
+FILE_BATCH_SIZE = 500
+
+# stat() paralel; di atas ~4 worker per volume tidak ada percepatan lagi.
+SCAN_WORKERS = 4
+
+# Worker pool proses (opt-in lewat use_processes): satu proses disisakan untuk UI.
+PROCESS_SCAN_WORKERS = max((os.cpu_count() or 2) - 1, 1)
+
+HIGH_SENSITIVITY_EXTENSIONS = (
+    '.env', '.key', '.pem', '.crt', '.p12', '.pfx',
+    '.pwd', '.password', '.secret', '.token',
+    '.credentials', '.auth',
+)
+
+HIGH_SENSITIVITY_PATTERNS = (
+    'id_rsa', 'id_dsa', 'id_ecdsa', 'id_ed25519',
+    'authorized_keys', 'known_hosts',
+    '.htpasswd', '.htaccess',
+    'shadow', 'passwd', 'sudoers',
+    'master.key', 'credentials.yml',
+    'secrets.yaml', 'secrets.json',
+    'wp-config.php',
+    '.netrc', '.pgpass',
+)
+
+HIGH_SENSITIVITY_DIRS = ('.ssh', '.gnupg', 'private', 'secrets', 'credentials')
+
+MEDIUM_SENSITIVITY_EXTENSIONS = (
+    '.conf', '.config', '.cfg', '.ini', '.yaml', '.yml',
+    '.xml', '.properties',
+    '.sql', '.db', '.sqlite', '.sqlite3',
+    '.log',
+    '.sh', '.bash', '.zsh', '.py', '.rb', '.pl',
+)
+
+MEDIUM_SENSITIVITY_PATTERNS = (
+    'config', 'settings', 'database',
+    'nginx', 'apache', 'httpd',
+    'docker-compose', 'dockerfile',
+    'makefile', 'rakefile',
+)
+
+SENSITIVE_SYSTEM_PATHS = (
+    '/etc', '/bin', '/sbin', '/usr/bin', '/usr/sbin',
+    '/lib', '/lib64', '/usr/lib',
+    '/root', '/var/log', '/var/run',
+    '/boot', '/proc', '/sys', '/dev',
+    '/home/root', '/.ssh', '/.gnupg',
+    '/etc/passwd', '/etc/shadow', '/etc/sudoers',
+)
+
+_HIGH_SENSITIVITY_DIR_MARKERS = tuple(f'/{d}/' for d in HIGH_SENSITIVITY_DIRS)
+_HIGH_SENSITIVITY_DIR_SUFFIXES = tuple(f'/{d}' for d in HIGH_SENSITIVITY_DIRS)
+
+
+def _high_sensitivity_risk(mode: int) -> str:
+    if mode & 0o077:
+        return 'High'
+    return 'Low'
+
+
+def _medium_sensitivity_risk(mode: int) -> str:
+    if mode & 0o022 or mode > 0o755:
+        return 'Medium'
+    return 'Low'
+
+
+# Risiko per mode (0..0o777) untuk file sensitivitas tinggi/sedang.
+_HIGH_SENSITIVITY_RISK = tuple(_high_sensitivity_risk(m) for m in range(0o1000))
+_MEDIUM_SENSITIVITY_RISK = tuple(_medium_sensitivity_risk(m) for m in range(0o1000))
+
+
+RISK_LEVELS = ('Low', 'Medium', 'High')
+RISK_CODES = {level: code for code, level in enumerate(RISK_LEVELS)}
+
+
+class ScanResults:
+    """
+    Hasil scan dalam bentuk kolom (satu array per field) alih-alih list of dicts.
     
-    def __init__(self, folder_path: str, custom_rules: Dict, max_files: int = 10000):
-        super().__init__()
-        self.folder_path = folder_path
-        self.custom_rules = custom_rules
-        self.max_files = max_files
-        self.all_files = []
-        self.is_cancelled = False
-        self.mutex = QMutex()
-        self.file_count = 0
-        self.total_files = 0
-        
-        self.stats = {
-            'total_files': 0,
-            'total_size': 0,
-            'high_risk': 0,
-            'medium_risk': 0,
-            'low_risk': 0,
-            'symlinks': 0,
-            'permission_denied': 0,
-            'start_time': None,
-            'end_time': None,
-            'duration': 0
+    Risk disimpan sebagai kode byte (0=Low, 1=Medium, 2=High); hitungan per
+    level dijaga saat extend sehingga risk_counts O(1). Indexing/iterasi menghasilkan dict
+    record dengan bentuk yang sama seperti yang dikirim ScanThread.
+    """
+    
+    def __init__(self):
+        self.paths: List[str] = []
+        self.relatives: List[str] = []
+        self.names: List[str] = []
+        self.expected: List[Optional[str]] = []
+        self.modes = array('L')
+        self.sizes = array('Q')
+        self.mtimes = array('d')
+        self.symlinks = bytearray()
+        self.risks = bytearray()
+        self._risk_counts = [0] * len(RISK_LEVELS)
+    
+    def extend(self, records: Iterable[Dict]):
+        for file_data in records:
+            info = file_data['info']
+            self.paths.append(file_data['path'])
+            self.relatives.append(file_data['relative'])
+            self.names.append(file_data['name'])
+            self.expected.append(file_data['expected'])
+            self.modes.append(info['st_mode'])
+            self.sizes.append(info['size'])
+            self.mtimes.append(info['mtime'])
+            self.symlinks.append(info['is_symlink'])
+            code = RISK_CODES[file_data['risk']]
+            self.risks.append(code)
+            self._risk_counts[code] += 1
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __getitem__(self, index: int) -> Dict:
+        return {
+            'path': self.paths[index],
+            'relative': self.relatives[index],
+            'name': self.names[index],
+            'info': {
+                'st_mode': self.modes[index],
+                'size': self.sizes[index],
+                'mtime': self.mtimes[index],
+                'is_symlink': bool(self.symlinks[index])
+            },
+            'risk': RISK_LEVELS[self.risks[index]],
+            'expected': self.expected[index],
+            'backup_status': 'none',
+            'encryption_status': 'none'
         }
     
-    def cancel(self):
-        self.mutex.lock()
-        self.is_cancelled = True
-        self.mutex.unlock()
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self.paths)):
+            yield self[index]
     
-    def run(self):
-        try:
-            self.stats['start_time'] = datetime.now().isoformat()
-            
-            self._scan_folder(self.folder_path)
-            
-            self.stats['end_time'] = datetime.now().isoformat()
-            self.stats['duration'] = (datetime.now() - datetime.fromisoformat(self.stats['start_time'])).total_seconds()
-            
-            self.progress.emit(100, "Scan completed")
-            self.finished.emit(self.all_files, self.stats)
-            
-        except Exception as e:
-            import traceback
-            self.error.emit(str(e), traceback.format_exc())
+    def risk_counts(self) -> Dict[str, int]:
+        return dict(zip(RISK_LEVELS, self._risk_counts))
     
-    def _scan_folder(self, folder_path: str):
+    def indices_at_risk(self, minimum: str = 'Medium') -> List[int]:
+        floor = RISK_CODES[minimum]
+        return [index for index, code in enumerate(self.risks) if code >= floor]
+
+
+class FileClassifier:
+    """
+    Per-file work of a scan: stat, risk level and custom rule for each entry.
+    
+    Kept apart from ScanThread (and free of Qt) so worker processes can build
+    their own copy from plain arguments. With include_hidden=False dot-folders
+    are skipped too, except the sensitive ones in HIGH_SENSITIVITY_DIRS.
+    """
+    
+    def __init__(self, folder_path: str, custom_rules: Dict,
+                 prune_dirs: Optional[Iterable[str]] = PRUNE_DIRS,
+                 include_hidden: bool = True):
+        self.folder_path = folder_path
+        self.prune_dirs = frozenset(prune_dirs or ())
+        self.include_hidden = include_hidden
+        self._base_len = len(folder_path.rstrip(os.sep)) + 1
+        self._rules = tuple(custom_rules.items())
+        self._rules_re = re.compile('|'.join(map(re.escape, custom_rules))) if custom_rules else None
+        self._dir_rule_cache: Dict[str, int] = {}
+    
+    def scan_chunk(self, dirs: List[str], limit: int = FILE_BATCH_SIZE) -> Tuple[List[Dict], int, int, List[str]]:
+        """
+        Walk dirs depth-first until about limit records are collected.
+        
+        Returns (records, denied count, skipped dir count, directories still
+        to scan) so the caller can hand the rest out as new tasks.
+        """
+        stack = list(dirs)
+        records, denied, pruned = [], 0, 0
+        while stack and len(records) < limit:
+            subdirs, found, skipped, skipped_dirs = self.scan_dir(stack.pop())
+            stack.extend(subdirs)
+            records.extend(found)
+            denied += skipped
+            pruned += skipped_dirs
+        return records, denied, pruned, stack
+    
+    def scan_dir(self, path: str) -> Tuple[List[str], List[Dict], int, int]:
+        """Scan one directory (di worker): subdirs to descend into, file records, denied and skipped dir counts."""
+        subdirs, records, denied, pruned = [], [], 0, 0
         try:
-            for root, dirs, files in os.walk(folder_path):
-                self.mutex.lock()
-                if self.is_cancelled:
-                    self.mutex.unlock()
-                    return
-                self.mutex.unlock()
-                
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    file_data = self._scan_file(filepath)
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.is_symlink():
+                            continue
+                        if self._skip_dir(entry.name):
+                            pruned += 1
+                        else:
+                            subdirs.append(entry.path)
+                        continue
+                    try:
+                        file_data = self.scan_file(entry)
+                    except PermissionError:
+                        denied += 1
+                        continue
                     if file_data:
-                        self.all_files.append(file_data)
-                        self.file_found.emit(file_data)
-                        self._update_stats(file_data)
-                        
-                        self.file_count += 1
-                        if self.total_files > 0:
-                            progress = int((self.file_count / min(self.total_files, self.max_files)) * 100)
-                            self.progress.emit(min(progress, 100), f"Scanned {self.file_count} files")
-                    
-                    if self.file_count >= self.max_files:
-                        break
-                
-                if self.file_count >= self.max_files:
-                    break
-                    
-        except Exception as e:
-            import traceback
-            self.error.emit(f"Scan error: {str(e)}", traceback.format_exc())
+                        records.append(file_data)
+        except OSError:
+            pass
+        return subdirs, records, denied, pruned
     
-    def _scan_file(self, filepath: str) -> Optional[Dict]:
+    def _skip_dir(self, name: str) -> bool:
+        if name in self.prune_dirs:
+            return True
+        return (not self.include_hidden and name.startswith('.')
+                and name not in HIGH_SENSITIVITY_DIRS)
+    
+    def scan_file(self, entry: os.DirEntry) -> Optional[Dict]:
         try:
-            is_symlink = os.path.islink(filepath)
-            if is_symlink:
-                self.stats['symlinks'] += 1
-                stat_func = os.lstat
-            else:
-                stat_func = os.stat
+            filepath = entry.path
+            is_symlink = entry.is_symlink()
             
-            file_stat = stat_func(filepath)
+            file_stat = entry.stat(follow_symlinks=False)
             
             mode = file_stat.st_mode
-            is_readable = bool(mode & stat.S_IRUSR)
-            is_writable = bool(mode & stat.S_IWUSR)
-            is_executable = bool(mode & stat.S_IXUSR)
-            
-            mode_octal = oct(mode)[-3:]
-            mode_symbolic = stat.filemode(mode)
             
-            relative_path = os.path.relpath(filepath, self.folder_path)
+            assert filepath.startswith(self.folder_path), filepath
+            relative_path = filepath[self._base_len:]
             
-            risk_level = self._determine_risk_level(mode_octal, filepath, is_symlink)
+            risk_level = self.determine_risk_level(mode & 0o777, filepath, is_symlink)
             
-            expected_perm = self._check_custom_rules(filepath)
+            expected_perm = self.check_custom_rules(filepath)
             
             file_data = {
                 'path': filepath,
                 'relative': relative_path,
-                'name': os.path.basename(filepath),
+                'name': entry.name,
                 'info': {
-                    'readable': is_readable,
-                    'writable': is_writable,
-                    'executable': is_executable,
-                    'mode': mode_octal,
-                    'symbolic': mode_symbolic,
+                    'st_mode': mode,
                     'size': file_stat.st_size,
-                    'modified': datetime.fromtimestamp(file_stat.st_mtime),
-                    'is_symlink': is_symlink,
-                    'is_dir': os.path.isdir(filepath) if not is_symlink else False
+                    'mtime': file_stat.st_mtime,
+                    'is_symlink': is_symlink
                 },
                 'risk': risk_level,
                 'expected': expected_perm,
@@ -149,12 +282,11 @@ class ScanThread(QThread):
             return file_data
             
         except PermissionError:
-            self.stats['permission_denied'] += 1
-            return None
+            raise
         except Exception:
             return None
     
-    def _determine_risk_level(self, mode: str, filepath: str, is_symlink: bool) -> str:
+    def determine_risk_level(self, mode: int, filepath: str, is_symlink: bool) -> str:
         """
         Determine risk level based on FILE SENSITIVITY + PERMISSION MATRIX.
         
@@ -171,127 +303,231 @@ class ScanThread(QThread):
         | Medium      | > 644      | Medium Risk|
         | Medium      | <= 644     | Low Risk   |
         | Low         | Any        | Low Risk   |
-        """
-        filename = os.path.basename(filepath).lower()
         
-        try:
-            mode_int = int(mode, 8)
-        except ValueError:
-            mode_int = 0o644
+        mode is the permission bits (st_mode & 0o777); the permission half of
+        the matrix is looked up in tables built at import.
+        """
+        path_lower = filepath.lower()
+        filename = os.path.basename(path_lower)
         
-        high_sensitivity_extensions = [
-            '.env', '.key', '.pem', '.crt', '.p12', '.pfx',
-            '.pwd', '.password', '.secret', '.token',
-            '.credentials', '.auth',
-        ]
+        if path_lower.endswith(HIGH_SENSITIVITY_EXTENSIONS):
+            return _HIGH_SENSITIVITY_RISK[mode]
+        if any(pattern in filename for pattern in HIGH_SENSITIVITY_PATTERNS):
+            return _HIGH_SENSITIVITY_RISK[mode]
+        if path_lower.endswith(_HIGH_SENSITIVITY_DIR_SUFFIXES) or any(
+                marker in path_lower for marker in _HIGH_SENSITIVITY_DIR_MARKERS):
+            return _HIGH_SENSITIVITY_RISK[mode]
+        if path_lower.endswith(MEDIUM_SENSITIVITY_EXTENSIONS):
+            return _MEDIUM_SENSITIVITY_RISK[mode]
+        if any(pattern in filename for pattern in MEDIUM_SENSITIVITY_PATTERNS):
+            return _MEDIUM_SENSITIVITY_RISK[mode]
+        if not is_symlink:
+            return 'Low'
         
-        high_sensitivity_patterns = [
-            'id_rsa', 'id_dsa', 'id_ecdsa', 'id_ed25519',
-            'authorized_keys', 'known_hosts',
-            '.htpasswd', '.htaccess',
-            'shadow', 'passwd', 'sudoers',
-            'master.key', 'credentials.yml',
-            'secrets.yaml', 'secrets.json',
-            'wp-config.php',
-            '.netrc', '.pgpass',
-        ]
+        try:
+            target = os.readlink(filepath)
+        except OSError:
+            return _MEDIUM_SENSITIVITY_RISK[mode]
         
-        high_sensitivity_dirs = ['.ssh', '.gnupg', 'private', 'secrets', 'credentials']
+        table = _HIGH_SENSITIVITY_RISK if os.path.isabs(target) or '..' in target else _MEDIUM_SENSITIVITY_RISK
         
-        medium_sensitivity_extensions = [
-            '.conf', '.config', '.cfg', '.ini', '.yaml', '.yml',
-            '.xml', '.properties',
-            '.sql', '.db', '.sqlite', '.sqlite3',
-            '.log',
-            '.sh', '.bash', '.zsh', '.py', '.rb', '.pl',
-        ]
+        try:
+            if not os.path.isabs(target):
+                target = os.path.normpath(os.path.join(os.path.dirname(filepath), target))
+            if any(target.startswith(sensitive_path) or sensitive_path in target
+                   for sensitive_path in SENSITIVE_SYSTEM_PATHS):
+                return 'High'
+        except ValueError:
+            pass
         
-        medium_sensitivity_patterns = [
-            'config', 'settings', 'database',
-            'nginx', 'apache', 'httpd',
-            'docker-compose', 'dockerfile',
-            'makefile', 'rakefile',
-        ]
+        return table[mode]
+    
+    def check_custom_rules(self, filepath: str) -> Optional[str]:
+        """
+        First rule (in dict order) whose pattern occurs anywhere in filepath.
         
-        sensitivity = 'low'
+        Patterns never contain a separator, so a match lies wholly in the
+        directory or wholly in the filename. The directory's best rule is
+        cached (len(rules) = no match); the filename is only checked when the
+        combined regex finds something in it.
+        """
+        directory, filename = os.path.split(filepath)
+        best = self._dir_rule_cache.get(directory)
+        if best is None:
+            best = self._first_rule(directory, len(self._rules))
+            self._dir_rule_cache[directory] = best
+        if self._rules_re is not None and self._rules_re.search(filename):
+            best = self._first_rule(filename, best)
+        return self._rules[best][1] if best < len(self._rules) else None
+    
+    def _first_rule(self, text: str, limit: int) -> int:
+        for index in range(limit):
+            if self._rules[index][0] in text:
+                return index
+        return limit
+
+
+# Di proses worker: (scan_id, classifier) untuk scan yang terakhir dilayani.
+_WORKER_SCAN: Tuple[int, Optional[FileClassifier]] = (-1, None)
+
+
+def _scan_chunk_in_worker(scan_id: int, config: Tuple, dirs: List[str]) -> Tuple[List[Dict], int, int, List[str]]:
+    """Worker dipakai ulang antar scan; classifier dibangun ulang hanya saat scan_id berganti."""
+    global _WORKER_SCAN
+    if _WORKER_SCAN[0] != scan_id:
+        _WORKER_SCAN = (scan_id, FileClassifier(*config))
+    return _WORKER_SCAN[1].scan_chunk(dirs)
+
+
+_SCAN_POOL: Optional[ThreadPoolExecutor] = None
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_SCAN_POOL_LOCK = threading.Lock()
+_SCAN_IDS = itertools.count()
+
+
+def _shared_scan_pool() -> ThreadPoolExecutor:
+    """Thread pool dipakai ulang antar scan, dibuat saat pertama dibutuhkan."""
+    global _SCAN_POOL
+    with _SCAN_POOL_LOCK:
+        if _SCAN_POOL is None:
+            _SCAN_POOL = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix='scan')
+        return _SCAN_POOL
+
+
+def _shared_process_pool() -> ProcessPoolExecutor:
+    """Process pool (spawn) dipakai ulang antar scan, dibuat saat pertama dibutuhkan."""
+    global _PROCESS_POOL
+    with _SCAN_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            _PROCESS_POOL = ProcessPoolExecutor(max_workers=PROCESS_SCAN_WORKERS,
+                                                mp_context=multiprocessing.get_context('spawn'))
+        return _PROCESS_POOL
+
+
+class ScanThread(QThread):
+    progress = pyqtSignal(int, str)
+    file_found = pyqtSignal(list)
+    stats_update = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str, str)
+    
+    def __init__(self, folder_path: str, custom_rules: Dict, max_files: int = 10000,
+                 prune_dirs: Optional[Iterable[str]] = PRUNE_DIRS,
+                 use_processes: bool = False, include_hidden: bool = True):
+        super().__init__()
+        self.folder_path = folder_path
+        self.custom_rules = custom_rules
+        self.max_files = max_files
+        self.prune_dirs = frozenset(prune_dirs or ())
+        self.include_hidden = include_hidden
+        self._classifier = FileClassifier(folder_path, custom_rules, self.prune_dirs, include_hidden)
+        self.use_processes = use_processes
+        self._batch = []
+        self.is_cancelled = False
+        self.mutex = QMutex()
+        self.file_count = 0
         
-        if any(filepath.lower().endswith(ext) for ext in high_sensitivity_extensions):
-            sensitivity = 'high'
-        elif any(pattern in filename for pattern in high_sensitivity_patterns):
-            sensitivity = 'high'
-        elif any(f'/{dir_name}/' in filepath.lower() or filepath.lower().endswith(f'/{dir_name}') 
-               for dir_name in high_sensitivity_dirs):
-            sensitivity = 'high'
-        elif any(filepath.lower().endswith(ext) for ext in medium_sensitivity_extensions):
-            sensitivity = 'medium'
-        elif any(pattern in filename for pattern in medium_sensitivity_patterns):
-            sensitivity = 'medium'
-        elif is_symlink:
-            try:
-                target = os.readlink(filepath)
-                if os.path.isabs(target) or '..' in target:
-                    sensitivity = 'high'
-                else:
-                    sensitivity = 'medium'
-            except OSError:
-                sensitivity = 'medium'
+        self.stats = {
+            'total_files': 0,
+            'total_size': 0,
+            'high_risk': 0,
+            'medium_risk': 0,
+            'low_risk': 0,
+            'symlinks': 0,
+            'permission_denied': 0,
+            'skipped_dirs': 0,
+            'start_time': None,
+            'end_time': None,
+            'duration': 0
+        }
+    
+    def cancel(self):
+        self.mutex.lock()
+        self.is_cancelled = True
+        self.mutex.unlock()
+    
+    def run(self):
+        try:
+            self.stats['start_time'] = datetime.now().isoformat()
             
-            try:
-                target = os.readlink(filepath)
-                if not os.path.isabs(target):
-                    target = os.path.normpath(os.path.join(os.path.dirname(filepath), target))
-                
-                sensitive_system_paths = [
-                    '/etc', '/bin', '/sbin', '/usr/bin', '/usr/sbin',
-                    '/lib', '/lib64', '/usr/lib',
-                    '/root', '/var/log', '/var/run',
-                    '/boot', '/proc', '/sys', '/dev',
-                    '/home/root', '/.ssh', '/.gnupg',
-                    '/etc/passwd', '/etc/shadow', '/etc/sudoers',
-                ]
-                
-                for sensitive_path in sensitive_system_paths:
-                    if target.startswith(sensitive_path) or sensitive_path in target:
-                        return 'High'
-                        
-            except (OSError, ValueError):
-                pass
-        
-        if sensitivity == 'high':
-            others_perms = mode_int & 0o007
-            group_perms = mode_int & 0o070
+            self._scan_folder(self.folder_path)
+            self._flush_batch()
             
-            if others_perms > 0 or group_perms > 0:
-                return 'High'
-            elif (mode_int & 0o777) > 0o600:
-                return 'High' if (mode_int & 0o077) > 0 else 'Low'
-            else:
-                return 'Low'
-        
-        elif sensitivity == 'medium':
-            others_write = mode_int & 0o002
-            group_write = mode_int & 0o020
+            self.stats['end_time'] = datetime.now().isoformat()
+            self.stats['duration'] = (datetime.now() - datetime.fromisoformat(self.stats['start_time'])).total_seconds()
             
-            if others_write > 0 or group_write > 0:
-                return 'Medium'
-            elif (mode_int & 0o777) > 0o755:
-                return 'Medium'
-            else:
-                return 'Low'
+            self.progress.emit(100, "Scan completed")
+            self.finished.emit(self.stats)
+            
+        except Exception as e:
+            import traceback
+            self.error.emit(str(e), traceback.format_exc())
+    
+    def _scan_folder(self, folder_path: str):
+        """
+        Scan direktori secara paralel; thread ini satu-satunya konsumen hasil,
+        jadi statistik dan batch tidak perlu dikunci.
         
+        Thread pool by default (stat melepas GIL). With use_processes the
+        caller opts into a spawn-based process pool that also runs
+        classification in parallel (CPU-bound trees, e.g. on Windows).
+        Both pools are shared across scans so their workers are reused.
+        """
+        if self.use_processes:
+            pool = _shared_process_pool()
+            config = (folder_path, self.custom_rules, self.prune_dirs, self.include_hidden)
+            task = functools.partial(_scan_chunk_in_worker, next(_SCAN_IDS), config)
         else:
-            return 'Low'
+            pool = _shared_scan_pool()
+            task = self._classifier.scan_chunk
+        pending = set()
+        try:
+            pending.add(pool.submit(task, [folder_path]))
+            while pending:
+                self.mutex.lock()
+                cancelled = self.is_cancelled
+                self.mutex.unlock()
+                if cancelled:
+                    return
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    records, denied, pruned, remaining = future.result()
+                    self.stats['permission_denied'] += denied
+                    self.stats['skipped_dirs'] += pruned
+                    for path in remaining:
+                        pending.add(pool.submit(task, [path]))
+                    
+                    for file_data in records:
+                        if self.file_count >= self.max_files:
+                            return
+                        self._batch.append(file_data)
+                        if len(self._batch) >= FILE_BATCH_SIZE:
+                            self._flush_batch()
+                        self._update_stats(file_data)
+                        
+                        self.file_count += 1
+                        if self.file_count & PROGRESS_MASK == 0:
+                            progress = self.file_count * 100 // self.max_files
+                            self.progress.emit(min(progress, 99), f"Scanned {self.file_count} files")
+                    
+        except Exception as e:
+            import traceback
+            self.error.emit(f"Scan error: {str(e)}", traceback.format_exc())
+        finally:
+            for future in pending:
+                future.cancel()
     
-    def _check_custom_rules(self, filepath: str) -> Optional[str]:
-        filename = os.path.basename(filepath)
-        for pattern, expected_perm in self.custom_rules.items():
-            if pattern in filepath or filename == pattern:
-                return expected_perm
-        return None
+    def _flush_batch(self):
+        if self._batch:
+            self.file_found.emit(self._batch)
+            self._batch = []
     
     def _update_stats(self, file_data: Dict):
         self.stats['total_files'] += 1
         self.stats['total_size'] += file_data['info']['size']
+        if file_data['info']['is_symlink']:
+            self.stats['symlinks'] += 1
         
         risk = file_data['risk']
         if risk == 'High':
@@ -1,9 +1,11 @@
 import ctypes
+import mmap
 import sys
 import os
 import platform
 import subprocess
 from typing import Optional
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
 
 if platform.system() == 'Linux':
     LIBC = ctypes.CDLL('libc.so.6')
@@ -11,6 +13,35 @@ if platform.system() == 'Linux':
     M_UNLOCKALL = 2
 
 
+def _resolve_secure_zero():
+    if platform.system() == 'Linux':
+        explicit_bzero = getattr(LIBC, 'explicit_bzero', None)
+        if explicit_bzero is not None:
+            explicit_bzero.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+            explicit_bzero.restype = None
+            return explicit_bzero
+    return lambda address, length: ctypes.memset(address, 0, length)
+
+
+# Held as a module global so the wipe is an opaque call the runtime can't elide.
+_SECURE_ZERO = _resolve_secure_zero()
+
+
+def wipe_bytearray(buf: bytearray):
+    """Zero a bytearray in place (untuk salinan sandi sementara)."""
+    if buf:
+        view = (ctypes.c_char * len(buf)).from_buffer(buf)
+        _SECURE_ZERO(ctypes.addressof(view), len(buf))
+        del view
+
+
+_CHUNK_SIZE = 1 << 20
+_ZEROS = memoryview(bytes(_CHUNK_SIZE))
+_WRITE_BATCH = 16
+_HAS_PWRITEV = hasattr(os, 'pwritev')
+_HAS_SENDFILE = platform.system() == 'Linux' and hasattr(os, 'sendfile')
+
+
 class SecureString:
     
     def __init__(self, value: str):
@@ -46,23 +77,121 @@ class SecureString:
 
 
 class SecureBuffer:
+    """
+    Byte buffer for secrets backed by its own anonymous mapping.
+    
+    On Linux the pages are locked in RAM, excluded from core dumps and
+    wiped in forked children. Unsupported steps are skipped silently.
+    """
     
     def __init__(self, data: bytes):
-        self._buffer = bytearray(data)
         self._length = len(data)
+        self._locked = False
+        self._buffer = self._allocate(max(self._length, 1))
+        self._buffer[:self._length] = data
+        self._protect()
+    
+    @staticmethod
+    def _allocate(size: int) -> mmap.mmap:
+        if os.name == 'posix':
+            return mmap.mmap(-1, size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS,
+                             prot=mmap.PROT_READ | mmap.PROT_WRITE)
+        return mmap.mmap(-1, size)
+    
+    def _address(self) -> int:
+        view = ctypes.c_char.from_buffer(self._buffer)
+        address = ctypes.addressof(view)
+        del view
+        return address
+    
+    def _protect(self):
+        for name in ('MADV_DONTDUMP', 'MADV_WIPEONFORK'):
+            advice = getattr(mmap, name, None)
+            if advice is not None:
+                try:
+                    self._buffer.madvise(advice)
+                except OSError:
+                    pass
+        
+        if platform.system() == 'Linux':
+            self._locked = LIBC.mlock(ctypes.c_void_p(self._address()),
+                                      ctypes.c_size_t(len(self._buffer))) == 0
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.clear()
+    
+    def __del__(self):
+        self.clear()
         
     def __bytes__(self):
-        return bytes(self._buffer)
+        if self._buffer.closed:
+            raise ValueError("Memory has been cleared")
+        return self._buffer[:self._length]
+    
+    def __len__(self):
+        return self._length
         
     def clear(self):
-        for i in range(self._length):
-            self._buffer[i] = 0
+        if not hasattr(self, '_buffer') or self._buffer.closed:
+            return
+        address = self._address()
+        _SECURE_ZERO(address, len(self._buffer))
+        if self._locked:
+            LIBC.munlock(ctypes.c_void_p(address), ctypes.c_size_t(len(self._buffer)))
+            self._locked = False
+        self._buffer.close()
+
+
+def _zero_pass_sendfile(fd: int, size: int) -> bool:
+    """Zero the file by splicing /dev/zero in-kernel; False if unsupported."""
+    try:
+        zero_fd = os.open('/dev/zero', os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        os.lseek(fd, 0, os.SEEK_SET)
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(fd, zero_fd, None, min(size - offset, _CHUNK_SIZE * _WRITE_BATCH))
+            if sent == 0:
+                return False
+            offset += sent
+        os.fsync(fd)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(zero_fd)
+
+
+def _keystream():
+    """ChaCha20 encryptor seeded from os.urandom; update(zeros) yields random bytes."""
+    cipher = Cipher(algorithms.ChaCha20(os.urandom(32), os.urandom(16)), mode=None)
+    return cipher.encryptor()
+
+
+def _overwrite_pass(fd: int, size: int, random_fill: bool = False):
+    batch = _WRITE_BATCH if _HAS_PWRITEV else 1
+    stream = _keystream() if random_fill else None
+    offset = 0
+    while offset < size:
+        chunks = []
+        end = min(size, offset + _CHUNK_SIZE * batch)
+        position = offset
+        while position < end:
+            length = min(end - position, _CHUNK_SIZE)
+            chunks.append(stream.update(_ZEROS[:length]) if random_fill else _ZEROS[:length])
+            position += length
+        
+        if _HAS_PWRITEV:
+            offset += os.pwritev(fd, chunks, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            offset += os.write(fd, chunks[0])
+    os.fsync(fd)
 
 
 def secure_delete_file(path: str, passes: int = 1) -> bool:
@@ -72,16 +201,15 @@ def secure_delete_file(path: str, passes: int = 1) -> bool:
     try:
         file_size = os.path.getsize(path)
         
-        with open(path, 'wb') as f:
-            f.write(b'\x00' * file_size)
-            f.flush()
-            os.fsync(f.fileno())
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            if not (_HAS_SENDFILE and _zero_pass_sendfile(fd, file_size)):
+                _overwrite_pass(fd, file_size)
             
             if passes > 1:
-                f.seek(0)
-                f.write(os.urandom(file_size))
-                f.flush()
-                os.fsync(f.fileno())
+                _overwrite_pass(fd, file_size, random_fill=True)
+        finally:
+            os.close(fd)
         
         os.remove(path)
         return True
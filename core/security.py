@@ -1,16 +1,158 @@
 import os
-import base64
+import atexit
+import binascii
+import hashlib
+import hmac
 import json
 import time
 import secrets
+import sqlite3
+import string
 import threading
-from typing import Tuple, Dict, Optional
-from cryptography.fernet import Fernet
+import weakref
+from contextvars import ContextVar
+from collections import OrderedDict, deque
+from typing import Tuple, Dict, Optional, List
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-from core.secure_memory import SecureString, SecureBuffer
+from core.secure_memory import SecureString, SecureBuffer, wipe_bytearray
+
+# (token, expiry) dalam satu nilai: dibaca/ditulis sekaligus tanpa lock. Tiap thread
+# punya context sendiri, jadi worker harus diberi sesi secara eksplisit.
+_SESSION: ContextVar[Tuple[Optional[str], float]] = ContextVar('session', default=(None, 0.0))
+
+_B64_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+
+_RATE_LIMIT_STRIPES = 16
+_RATE_LIMIT_KEYS_PER_STRIPE = 1024
+_RATE_LIMIT_FLUSH_INTERVAL = 5.0
+_RATE_LIMIT_FLUSH_BATCH = 32
+# Batas antrean tulis jika database lama tidak bisa ditulis; yang tertua dibuang dulu
+# (memori tetap memegang semua percobaan di jendela waktu).
+_RATE_LIMIT_PENDING_MAX = 4096
+_RATE_LIMIT_SWEEP_INTERVAL = 3600
+
+_SQL_INSERT_ATTEMPT = 'INSERT INTO rate_limit_attempts (key, timestamp) VALUES (?, ?)'
+_SQL_CLEAR_KEY = 'DELETE FROM rate_limit_attempts WHERE key = ?'
+_SQL_SWEEP = 'DELETE FROM rate_limit_attempts WHERE timestamp < ?'
+_SQL_LOAD_ALL = 'SELECT key, timestamp FROM rate_limit_attempts WHERE timestamp >= ? ORDER BY timestamp'
+_SQL_LOAD_KEY = ('SELECT timestamp FROM rate_limit_attempts WHERE key = ? AND timestamp >= ? '
+                 'ORDER BY timestamp DESC LIMIT ?')
+
+# Data lama (Fernet) selalu diawali b'gAAAAA'; data baru diberi byte versi.
+# 0x02: AES-GCM + verifikasi SHA-256, 0x03: AES-GCM + verifikasi BLAKE2b berkunci,
+# 0x04: seperti 0x03 tetapi kunci diturunkan dengan scrypt (bukan PBKDF2),
+# 0x05: scrypt 64 byte -> [kunci AES | kunci verifikasi], verifikasi = HMAC(kunci, VERIFY).
+_FORMAT_LEGACY = b'g'
+_FORMAT_AESGCM = b'\x02'
+_FORMAT_AESGCM_BLAKE2 = b'\x03'
+_FORMAT_AESGCM_SCRYPT = b'\x04'
+_FORMAT_AESGCM_KDF_VERIFY = b'\x05'
+_FORMAT_CURRENT = _FORMAT_AESGCM_KDF_VERIFY
+_AESGCM_FORMATS = frozenset({_FORMAT_AESGCM, _FORMAT_AESGCM_BLAKE2, _FORMAT_AESGCM_SCRYPT,
+                             _FORMAT_AESGCM_KDF_VERIFY})
+_BLAKE2_VERIFY_FORMATS = frozenset({_FORMAT_AESGCM_BLAKE2, _FORMAT_AESGCM_SCRYPT})
+_KDF_VERIFY_FORMATS = frozenset({_FORMAT_AESGCM_KDF_VERIFY})
+_SCRYPT_FORMATS = frozenset({_FORMAT_AESGCM_SCRYPT, _FORMAT_AESGCM_KDF_VERIFY})
+
+_SCRYPT_N = 2 ** 15
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_NONCE_SIZE = 12
+
+_sha256 = hashlib.sha256
+_VERIFY_PREFIX = b"VERIFY:"
+# Midstate setelah prefix; disalin per panggilan, tidak pernah di-update langsung.
+_VERIFY_STATE = _sha256(_VERIFY_PREFIX)
+_VERIFY_PERSON = b"VERIFY"
+
+# Satu RateLimiter per (db_path, max_attempts, window): percobaan gagal yang belum
+# di-flush harus terlihat oleh semua SecurityManager, termasuk milik worker.
+_RATE_LIMITERS: Dict[Tuple[str, int, int], "RateLimiter"] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+_KEY_CACHE_SIZE = 32
+_KEY_CACHE: "OrderedDict[Tuple[bytes, bytes, bool, int], SecureBuffer]" = OrderedDict()
+_CIPHER_CACHE: "OrderedDict[Tuple[type, bytes], object]" = OrderedDict()
+_KEY_CACHE_LOCK = threading.Lock()
+
+
+def _clear_key_cache():
+    with _KEY_CACHE_LOCK:
+        while _KEY_CACHE:
+            _, buffer = _KEY_CACHE.popitem()
+            buffer.clear()
+        _CIPHER_CACHE.clear()
+
+
+atexit.register(_clear_key_cache)
+
+
+def _flush_attempts(conn, db_lock: threading.Lock, pending: deque):
+    """
+    Tulis antrean baris (key, timestamp) dalam satu transaksi, sesuai urutan.
+    
+    Baris dengan timestamp None menghapus key (percobaan berhasil).
+    Jika gagal (mis. database terkunci), baris dikembalikan ke depan antrean.
+    """
+    rows = []
+    while pending:
+        rows.append(pending.popleft())
+    if not rows:
+        return
+    
+    with db_lock:
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                for key, ts in rows:
+                    if ts is None:
+                        conn.execute(_SQL_CLEAR_KEY, (key,))
+                    else:
+                        conn.execute(_SQL_INSERT_ATTEMPT, (key, ts))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        except Exception:
+            pending.extendleft(reversed(rows))
+            raise
+
+
+def _sweep_attempts(conn, db_lock: threading.Lock, window_seconds: int):
+    """Hapus baris di luar jendela waktu dan kembalikan halaman kosong ke OS."""
+    with db_lock:
+        conn.execute(_SQL_SWEEP, (time.time() - window_seconds,))
+        conn.execute('PRAGMA incremental_vacuum(100)').fetchall()
+
+
+def _flush_loop(conn, db_lock, pending, window_seconds, wakeup: threading.Event, stopped: threading.Event):
+    next_sweep = time.monotonic()
+    while not stopped.is_set():
+        wakeup.wait(_RATE_LIMIT_FLUSH_INTERVAL)
+        wakeup.clear()
+        try:
+            _flush_attempts(conn, db_lock, pending)
+            if time.monotonic() >= next_sweep:
+                _sweep_attempts(conn, db_lock, window_seconds)
+                next_sweep = time.monotonic() + _RATE_LIMIT_SWEEP_INTERVAL
+        except Exception as e:
+            print(f"Failed to flush rate limit attempts: {e}")
+
+
+def _close_limiter(conn, db_lock, pending, stopped: threading.Event):
+    stopped.set()
+    try:
+        _flush_attempts(conn, db_lock, pending)
+    except Exception as e:
+        print(f"Failed to flush rate limit attempts: {e}")
+    with db_lock:
+        conn.close()
 
 
 class DecryptionError(Exception):
@@ -40,21 +182,60 @@ class RateLimiter:
     Persistent rate limiter that stores failed attempts in database.
     
     Attempts are persisted to scan_logs.db, preventing reset by app restart.
+    Memory is the source of truth: every key gets a bounded ring of recent
+    attempts, all hydrated from the database once at startup, and changes
+    are written back by a background thread. Least recently used keys are
+    evicted; any key missing from memory is looked up in the database. In memory the
+    attempts are monotonic_ns ints; the database keeps wall-clock seconds.
+    Because memory is authoritative, use RateLimiter.shared() so every
+    SecurityManager in the process sees the same attempts.
     """
     
     def __init__(self, max_attempts: int = 5, window_seconds: int = 300, db_path: str = "scan_logs.db"):
         self.max_attempts = max_attempts
         self.window_seconds = window_seconds
+        self.window_ns = window_seconds * 1_000_000_000
         self.db_path = db_path
-        self.lock = threading.Lock()
+        self._locks = [threading.Lock() for _ in range(_RATE_LIMIT_STRIPES)]
+        self._maps: List["OrderedDict[str, deque]"] = [OrderedDict() for _ in range(_RATE_LIMIT_STRIPES)]
+        self._db_lock = threading.Lock()
+        self._conn = None
+        self._pending: deque = deque(maxlen=_RATE_LIMIT_PENDING_MAX)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
         self._init_table()
+        
+        if self._conn is not None:
+            self._hydrate()
+            args = (self._conn, self._db_lock, self._pending)
+            weakref.finalize(self, _close_limiter, *args, self._stopped)
+            threading.Thread(target=_flush_loop, args=(*args, self.window_seconds, self._wakeup, self._stopped),
+                             name="RateLimiterFlush", daemon=True).start()
+    
+    @classmethod
+    def shared(cls, max_attempts: int = 5, window_seconds: int = 300,
+               db_path: str = "scan_logs.db") -> "RateLimiter":
+        """Limiter bersama untuk db_path ini; dibuat sekali per proses."""
+        key = (os.path.abspath(db_path), max_attempts, window_seconds)
+        with _RATE_LIMITERS_LOCK:
+            limiter = _RATE_LIMITERS.get(key)
+            if limiter is None:
+                limiter = _RATE_LIMITERS[key] = cls(max_attempts, window_seconds, db_path)
+            return limiter
     
     def _init_table(self):
-        """Initialize rate limit table in database."""
-        import sqlite3
+        """Open the shared connection and initialize rate limit table in database."""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False,
+                                   isolation_level=None, cached_statements=64)
             cursor = conn.cursor()
+            # Hanya berlaku untuk DB baru (atau setelah VACUUM); tanpa efek jika tidak.
+            cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA cache_size=-20000')
+            cursor.execute('PRAGMA busy_timeout=5000')
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS rate_limit_attempts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -64,57 +245,88 @@ class RateLimiter:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_rate_key ON rate_limit_attempts(key)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_rate_timestamp ON rate_limit_attempts(timestamp)')
-            conn.commit()
-            conn.close()
+            cursor.execute('DROP INDEX IF EXISTS idx_rate_key')
+            cursor.execute('DROP INDEX IF EXISTS idx_rate_timestamp')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_rate_key_ts ON rate_limit_attempts(key, timestamp)')
+            self._conn = conn
         except Exception as e:
             print(f"Failed to initialize rate limit table: {e}")
     
-    def _cleanup_old_attempts(self, key: str, conn):
-        """Remove attempts older than window."""
-        import sqlite3
-        now = time.time()
-        cutoff = now - self.window_seconds
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM rate_limit_attempts WHERE key = ? AND timestamp < ?', (key, cutoff))
-        conn.commit()
+    def _hydrate(self):
+        """Muat percobaan semua key di dalam jendela waktu dengan satu query."""
+        try:
+            wall_now = time.time()
+            mono_now = time.monotonic_ns()
+            rows = self._conn.execute(_SQL_LOAD_ALL, (wall_now - self.window_seconds,)).fetchall()
+            for key, ts in rows:
+                _, attempts_map = self._stripe(key)
+                attempts = attempts_map.get(key)
+                if attempts is None:
+                    attempts = attempts_map[key] = deque(maxlen=self.max_attempts + 1)
+                attempts.append(mono_now - int((wall_now - ts) * 1_000_000_000))
+            for attempts_map in self._maps:
+                while len(attempts_map) > _RATE_LIMIT_KEYS_PER_STRIPE:
+                    attempts_map.popitem(last=False)
+        except Exception as e:
+            print(f"Failed to load rate limit attempts: {e}")
+    
+    def flush(self):
+        """Tulis antrean percobaan ke database sekarang juga."""
+        if self._conn is None:
+            return
+        _flush_attempts(self._conn, self._db_lock, self._pending)
+    
+    def _stripe(self, key: str) -> Tuple[threading.Lock, "OrderedDict[str, deque]"]:
+        i = hash(key) & (_RATE_LIMIT_STRIPES - 1)
+        return self._locks[i], self._maps[i]
+    
+    def _attempts_for(self, key: str, attempts_map: "OrderedDict[str, deque]") -> deque:
+        """Ring percobaan untuk key; jika tidak ada di memori (baru atau tergusur), muat dari database."""
+        attempts = attempts_map.get(key)
+        if attempts is not None:
+            attempts_map.move_to_end(key)
+            return attempts
+        
+        attempts = deque(maxlen=self.max_attempts + 1)
+        if self._conn is not None:
+            self._reload(key, attempts)
+        
+        attempts_map[key] = attempts
+        if len(attempts_map) > _RATE_LIMIT_KEYS_PER_STRIPE:
+            attempts_map.popitem(last=False)
+        return attempts
+    
+    def _reload(self, key: str, attempts: deque):
+        try:
+            if self._pending:
+                self.flush()
+            wall_now = time.time()
+            mono_now = time.monotonic_ns()
+            with self._db_lock:
+                rows = self._conn.execute(
+                    _SQL_LOAD_KEY, (key, wall_now - self.window_seconds, attempts.maxlen)
+                ).fetchall()
+            attempts.extend(mono_now - int((wall_now - row[0]) * 1_000_000_000)
+                            for row in reversed(rows))
+        except Exception as e:
+            print(f"Failed to load rate limit attempts: {e}")
     
     def check_limit(self, key: str) -> Dict:
         """Check if action is allowed based on persistent rate limit."""
-        import sqlite3
-        with self.lock:
+        lock, attempts_map = self._stripe(key)
+        with lock:
             try:
-                conn = sqlite3.connect(self.db_path, timeout=10)
-                
-                self._cleanup_old_attempts(key, conn)
-                
-                cursor = conn.cursor()
-                now = time.time()
-                cutoff = now - self.window_seconds
-                
-                cursor.execute(
-                    'SELECT COUNT(*) FROM rate_limit_attempts WHERE key = ? AND timestamp >= ?',
-                    (key, cutoff)
-                )
-                current_attempts = cursor.fetchone()[0]
-                
-                conn.close()
+                attempts = self._attempts_for(key, attempts_map)
+                now = time.monotonic_ns()
+                while attempts and now - attempts[0] > self.window_ns:
+                    attempts.popleft()
                 
+                current_attempts = len(attempts)
                 is_allowed = current_attempts < self.max_attempts
                 
                 wait_time = 0
                 if not is_allowed:
-                    conn = sqlite3.connect(self.db_path, timeout=10)
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        'SELECT MIN(timestamp) FROM rate_limit_attempts WHERE key = ? AND timestamp >= ?',
-                        (key, cutoff)
-                    )
-                    oldest = cursor.fetchone()[0]
-                    conn.close()
-                    if oldest:
-                        wait_time = int(self.window_seconds - (now - oldest))
+                    wait_time = (self.window_ns - (now - attempts[-self.max_attempts])) // 1_000_000_000
                 
                 return {
                     'allowed': is_allowed,
@@ -128,23 +340,22 @@ class RateLimiter:
                 return {'allowed': True, 'current_attempts': 0, 'remaining': self.max_attempts, 'wait_time': 0}
     
     def record_attempt(self, key: str, success: bool = False):
-        """Record an attempt in the persistent database."""
-        import sqlite3
-        with self.lock:
+        """Record an attempt in memory; the database is updated in the background."""
+        lock, attempts_map = self._stripe(key)
+        with lock:
             try:
-                conn = sqlite3.connect(self.db_path, timeout=10)
-                cursor = conn.cursor()
+                attempts = self._attempts_for(key, attempts_map)
                 
                 if success:
-                    cursor.execute('DELETE FROM rate_limit_attempts WHERE key = ?', (key,))
+                    attempts.clear()
                 else:
-                    cursor.execute(
-                        'INSERT INTO rate_limit_attempts (key, timestamp) VALUES (?, ?)',
-                        (key, time.time())
-                    )
+                    attempts.append(time.monotonic_ns())
                 
-                conn.commit()
-                conn.close()
+                # Tanpa database (gagal dibuka) hanya memori yang dipakai.
+                if self._conn is not None:
+                    self._pending.append((key, None if success else time.time()))
+                    if not success and len(self._pending) >= _RATE_LIMIT_FLUSH_BATCH:
+                        self._wakeup.set()
                 
             except Exception as e:
                 print(f"Failed to record rate limit attempt: {e}")
@@ -152,25 +363,129 @@ class RateLimiter:
 
 class SecurityManager:
     
+    _UPPER = frozenset(string.ascii_uppercase)
+    _LOWER = frozenset(string.ascii_lowercase)
+    _DIGITS = frozenset(string.digits)
+    _ALNUM = _UPPER | _LOWER | _DIGITS
+    
+    _ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()-_=+"
+    _ALPHABET_LEN = len(_ALPHABET)
+    _ALPHABET_BYTE_LIMIT = 256 - (256 % _ALPHABET_LEN)
+    
+    _STRENGTH_MAP = ("Very Weak", "Weak", "Medium", "Strong", "Very Strong", "Excellent", "Unbreakable")
+    
+    salt_file = '.master_password.secure'
+    
     def __init__(self):
-        self.salt_file = '.master_password.secure'
-        self.rate_limiter = RateLimiter()
-        self.session_token = None
-        self.session_expiry = 0
+        self.rate_limiter = RateLimiter.shared()
+    
+    @property
+    def session_token(self) -> Optional[str]:
+        return _SESSION.get()[0]
+    
+    @property
+    def session_expiry(self) -> float:
+        return _SESSION.get()[1]
     
-    def derive_key(self, password: str, salt: bytes = None) -> Tuple[bytes, bytes]:
+    def get_session(self) -> Tuple[Optional[str], float]:
+        """Sesi aktif untuk context/thread ini sebagai (token, expiry)."""
+        return _SESSION.get()
+    
+    def set_session(self, token: Optional[str], expiry: float):
+        _SESSION.set((token, expiry))
+    
+    def derive_raw_key(self, password: str, salt: bytes = None,
+                       version: bytes = _FORMAT_CURRENT) -> Tuple[bytes, bytes]:
+        """Derive the raw 32-byte key (scrypt or PBKDF2, by format version); returns (key, salt)."""
+        material, salt = self._derive_material(password, salt, version)
+        return material[:32], salt
+    
+    @staticmethod
+    def _material_cache_key(password_bytes: bytearray, salt: bytes, version: bytes) -> Tuple[bytes, bytes, bool, int]:
+        return (hashlib.blake2b(password_bytes, digest_size=16, key=salt).digest(), salt,
+                version in _SCRYPT_FORMATS, 64 if version in _KDF_VERIFY_FORMATS else 32)
+    
+    @staticmethod
+    def _store_material(cache_key: Tuple[bytes, bytes, bool, int], material: bytes):
+        with _KEY_CACHE_LOCK:
+            _KEY_CACHE[cache_key] = SecureBuffer(material)
+            if len(_KEY_CACHE) > _KEY_CACHE_SIZE:
+                _, evicted = _KEY_CACHE.popitem(last=False)
+                evicted.clear()
+    
+    def _remember_material(self, password: str, salt: bytes, version: bytes, material: bytes):
+        """Simpan material KDF ke cache setelah sandi terbukti cocok."""
+        password_bytes = bytearray(password.encode())
+        try:
+            cache_key = self._material_cache_key(password_bytes, salt, version)
+        finally:
+            wipe_bytearray(password_bytes)
+        self._store_material(cache_key, material)
+    
+    def _derive_material(self, password: str, salt: bytes, version: bytes,
+                         store: bool = True) -> Tuple[bytes, bytes]:
+        """
+        KDF output for version: 32 bytes, or 64 (AES key + verify key) for 0x05.
+        
+        With store=False a cached result is still used, but a fresh one is not
+        cached (for guesses that have not been verified yet).
+        """
+        use_scrypt = version in _SCRYPT_FORMATS
+        length = 64 if version in _KDF_VERIFY_FORMATS else 32
+        # Salt baru tidak akan muncul lagi, jadi tidak perlu masuk cache.
+        cacheable = salt is not None
         if salt is None:
             salt = os.urandom(16)
+        
+        password_bytes = bytearray(password.encode())
+        try:
+            if cacheable:
+                cache_key = self._material_cache_key(password_bytes, salt, version)
+                with _KEY_CACHE_LOCK:
+                    cached = _KEY_CACHE.get(cache_key)
+                    if cached is not None:
+                        _KEY_CACHE.move_to_end(cache_key)
+                        return bytes(cached), salt
             
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=480000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+            if use_scrypt:
+                kdf = Scrypt(salt=salt, length=length, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+            else:
+                kdf = PBKDF2HMAC(
+                    algorithm=hashes.SHA256(),
+                    length=length,
+                    salt=salt,
+                    iterations=480000,
+                )
+            key = kdf.derive(password_bytes)
+        finally:
+            wipe_bytearray(password_bytes)
+        
+        if cacheable and store:
+            self._store_material(cache_key, key)
         return key, salt
     
+    @staticmethod
+    def _get_cipher(cipher_type: type, key: bytes):
+        """Return a cached Fernet or AESGCM instance for key."""
+        cache_key = (cipher_type, hashlib.blake2b(key, digest_size=16).digest())
+        with _KEY_CACHE_LOCK:
+            cipher = _CIPHER_CACHE.get(cache_key)
+            if cipher is not None:
+                _CIPHER_CACHE.move_to_end(cache_key)
+                return cipher
+        
+        cipher = cipher_type(key)
+        with _KEY_CACHE_LOCK:
+            _CIPHER_CACHE[cache_key] = cipher
+            if len(_CIPHER_CACHE) > _KEY_CACHE_SIZE:
+                _CIPHER_CACHE.popitem(last=False)
+        return cipher
+    
+    @staticmethod
+    def clear_key_cache():
+        """Wipe all cached derived keys (panggil saat logout / sesi habis)."""
+        _clear_key_cache()
+    
     def encrypt_data(self, data: bytes, password: str) -> Dict[str, bytes]:
         """
         Encrypt data with password.
@@ -182,11 +497,12 @@ class SecurityManager:
         Returns:
             Dict with 'data' (encrypted), 'salt', and 'verification_hash'
         """
-        key, salt = self.derive_key(password)
-        f = Fernet(key)
-        encrypted = f.encrypt(data)
+        material, salt = self._derive_material(password, None, _FORMAT_CURRENT)
+        aead = AESGCM(material[:32])
+        nonce = os.urandom(_NONCE_SIZE)
+        encrypted = _FORMAT_CURRENT + nonce + aead.encrypt(nonce, data, None)
         
-        verification_hash = self._create_verification_hash(password, salt)
+        verification_hash = hmac.new(material[32:], _VERIFY_PERSON, hashlib.sha256).digest()
         
         return {
             'data': encrypted,
@@ -224,16 +540,15 @@ class SecurityManager:
                 remaining_time=rate_check['wait_time']
             )
         
+        version = encrypted_data[:1]
         try:
             if verification_hash:
-                if not self._verify_password(password, salt, verification_hash):
+                if not self._verify_password(password, salt, verification_hash, version):
                     self.rate_limiter.record_attempt("decrypt", success=False)
                     raise InvalidPasswordError("Sandi salah! Password yang Anda masukkan tidak valid.")
             
-            key, _ = self.derive_key(password, salt)
-            f = Fernet(key)
-            
-            decrypted = f.decrypt(encrypted_data)
+            key, _ = self.derive_raw_key(password, salt, version)
+            decrypted = self._decrypt_with_key(encrypted_data, key)
             
             self.rate_limiter.record_attempt("decrypt", success=True)
             
@@ -248,33 +563,77 @@ class SecurityManager:
         except Exception as e:
             self.rate_limiter.record_attempt("decrypt", success=False)
             
-            error_str = str(e).lower()
-            if 'invalidtoken' in error_str or 'token' in error_str or 'decrypt' in error_str:
+            if isinstance(e, (InvalidTag, InvalidToken)):
                 raise InvalidPasswordError(
                     "Sandi salah! Dekripsi gagal karena password tidak valid."
                 )
             
             raise DecryptionError(f"Dekripsi gagal: {str(e)}")
     
-    def verify_password(self, password: str, salt: bytes, verification_hash: bytes) -> bool:
+    def _decrypt_with_key(self, encrypted_data: bytes, key: bytes) -> bytes:
+        if encrypted_data[:1] in _AESGCM_FORMATS:
+            aead = self._get_cipher(AESGCM, key)
+            nonce = encrypted_data[1:1 + _NONCE_SIZE]
+            return aead.decrypt(nonce, encrypted_data[1 + _NONCE_SIZE:], None)
+        fernet_key = binascii.b2a_base64(key, newline=False).translate(_B64_TO_URLSAFE)
+        return self._get_cipher(Fernet, fernet_key).decrypt(encrypted_data)
+    
+    def verify_password(self, password: str, salt: bytes, verification_hash: bytes,
+                        version: bytes = _FORMAT_CURRENT) -> bool:
         """
         Public method to verify if a password is correct.
         
+        Args:
+            version: Format byte of the encrypted data (its first byte)
+        
         Returns:
             True if password is correct, False otherwise
         """
-        return self._verify_password(password, salt, verification_hash)
+        return self._verify_password(password, salt, verification_hash, version)
     
-    def _create_verification_hash(self, password: str, salt: bytes) -> bytes:
-        """Create a hash for password verification."""
-        import hashlib
-        data = b"VERIFY:" + password.encode() + salt
-        return hashlib.sha256(data).digest()
+    def _create_verification_hash(self, password: str, salt: bytes,
+                                  version: bytes = _FORMAT_CURRENT) -> bytes:
+        """
+        Create a hash for password verification.
+        
+        Current data uses an HMAC under the second half of the KDF output, so
+        checking a guess costs a full scrypt run. Format 0x03/0x04 use keyed
+        BLAKE2b (salt as key); older data uses the SHA-256 VERIFY: midstate.
+        """
+        if version in _KDF_VERIFY_FORMATS:
+            material, _ = self._derive_material(password, salt, version, store=False)
+            return hmac.new(material[32:], _VERIFY_PERSON, hashlib.sha256).digest()
+        
+        password_bytes = bytearray(password.encode())
+        try:
+            if version in _BLAKE2_VERIFY_FORMATS:
+                return hashlib.blake2b(password_bytes, digest_size=32, key=salt,
+                                       person=_VERIFY_PERSON).digest()
+            h = _VERIFY_STATE.copy()
+            h.update(password_bytes)
+            h.update(salt)
+            return h.digest()
+        finally:
+            wipe_bytearray(password_bytes)
     
-    def _verify_password(self, password: str, salt: bytes, stored_hash: bytes) -> bool:
+    def _verify_password(self, password: str, salt: bytes, stored_hash: bytes,
+                         version: bytes = _FORMAT_CURRENT) -> bool:
         """Verify password against stored hash."""
-        expected_hash = self._create_verification_hash(password, salt)
-        return secrets.compare_digest(expected_hash, stored_hash)
+        material = None
+        if version in _KDF_VERIFY_FORMATS:
+            # Material KDF baru masuk cache setelah sandi terbukti cocok.
+            material, _ = self._derive_material(password, salt, version, store=False)
+            expected_hash = hmac.new(material[32:], _VERIFY_PERSON, hashlib.sha256).digest()
+        else:
+            expected_hash = self._create_verification_hash(password, salt, version)
+        stored_hash = stored_hash or b''
+        # Selalu bandingkan 32 byte; panjang dicek setelahnya agar tidak short-circuit.
+        padded = bytes(stored_hash[:len(expected_hash)]).ljust(len(expected_hash), b'\0')
+        matches = secrets.compare_digest(expected_hash, padded)
+        matches &= len(stored_hash) == len(expected_hash)
+        if matches and material is not None:
+            self._remember_material(password, salt, version, material)
+        return matches
     
     def check_password_strength(self, password: str) -> Dict:
         score = 0
@@ -286,28 +645,40 @@ class SecurityManager:
             score += 1
             if len(password) >= 12: score += 1
             
-        if any(c.isupper() for c in password): score += 1
+        chars = set(password)
+        if password.isascii():
+            has_upper = not self._UPPER.isdisjoint(chars)
+            has_lower = not self._LOWER.isdisjoint(chars)
+            has_digit = not self._DIGITS.isdisjoint(chars)
+            has_special = not chars <= self._ALNUM
+        else:
+            has_upper = any(c.isupper() for c in chars)
+            has_lower = any(c.islower() for c in chars)
+            has_digit = any(c.isdigit() for c in chars)
+            has_special = any(not c.isalnum() for c in chars)
+        
+        if has_upper: score += 1
         else: feedback.append("Add uppercase letters")
             
-        if any(c.islower() for c in password): score += 1
+        if has_lower: score += 1
         
-        if any(c.isdigit() for c in password): score += 1
+        if has_digit: score += 1
         else: feedback.append("Add numbers")
             
-        if any(not c.isalnum() for c in password): score += 1
+        if has_special: score += 1
         else: feedback.append("Add special characters")
         
-        strength_map = {
-            0: "Very Weak", 1: "Weak", 2: "Medium",
-            3: "Strong", 4: "Very Strong", 5: "Excellent", 6: "Unbreakable"
-        }
-        
+        score = min(score, 6)
         return {
-            'score': min(score, 6),
-            'strength': strength_map.get(min(score, 6)),
+            'score': score,
+            'strength': self._STRENGTH_MAP[score],
             'feedback': feedback
         }
         
     def generate_secure_password(self, length: int = 16) -> str:
-        alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()-_=+"
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        chars = []
+        while len(chars) < length:
+            raw = secrets.token_bytes(length * 2)
+            chars.extend(self._ALPHABET[b % self._ALPHABET_LEN]
+                         for b in raw if b < self._ALPHABET_BYTE_LIMIT)
+        return "".join(chars[:length])
@@ -12,51 +12,126 @@ r"""╔════════════════════════
 
 import sys
 import os
+import re
 from pathlib import Path
 
 from PyQt6.QtWidgets import QApplication, QSplashScreen
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap, QFont, QPainter, QColor, QLinearGradient
+from PyQt6.QtGui import QBitmap, QPixmap, QPixmapCache, QFont, QPainter, QPainterPath, QColor, QLinearGradient
 
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from ui.main_window import FilePermissionChecker
+# Splash yang sudah dirender; naikkan versi di nama file jika desain splash berubah.
+SPLASH_CACHE = project_root / '.splash_cache_v2.png'
+SPLASH_PIXMAP_KEY = 'splash_v2'
+
+_QSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_QSS_SPACE = re.compile(r'\s+')
+_QSS_PUNCT_SPACE = re.compile(r'\s*([{};])\s*')
+
+# Dipakai jika style.qss tidak ada; nilai warna sama dengan style.qss.
+_FALLBACK_QSS = (
+    "QMainWindow{background-color:#0d0d0d;}"
+    "QWidget{color:#e5e5e5;}"
+    "QPushButton{background:#262626;border:1px solid #333333;border-radius:6px;"
+    "padding:10px 20px;color:#e5e5e5;font-weight:500;}"
+    "QPushButton:hover{background:#333333;}"
+)
+
+_STYLES_APPLIED = False
 
 class ModernSplashScreen(QSplashScreen):    
+    _family = None
+    _outer_path = None
+    _inner_path = None
+
     def __init__(self):
+        super().__init__(ModernSplashScreen.splash_pixmap())
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
+        self.setMask(self._corner_mask())
+        
+        self._progress = 0
+        self._loading_steps = [
+            "Initializing...",
+            "Loading modules...",
+            "Preparing database...",
+            "Setting up security...",
+            "Loading interface...",
+            "Almost ready..."
+        ]
+
+    @staticmethod
+    def splash_pixmap() -> QPixmap:
+        """
+        Artwork splash: dari QPixmapCache, lalu file PNG, baru dirender jika keduanya tidak ada.
+        
+        UI lain yang menampilkan artwork yang sama sebaiknya memakai ini juga.
+        """
+        pixmap = QPixmapCache.find(SPLASH_PIXMAP_KEY)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        pixmap = QPixmap(str(SPLASH_CACHE)) if SPLASH_CACHE.exists() else QPixmap()
+        if pixmap.isNull():
+            pixmap = ModernSplashScreen._render_pixmap()
+            pixmap.save(str(SPLASH_CACHE), "PNG")
+        QPixmapCache.insert(SPLASH_PIXMAP_KEY, pixmap)
+        return pixmap
+
+    @staticmethod
+    def _pick_family() -> str:
+        """Inter jika terpasang, selain itu Segoe UI; database font cukup dicek sekali."""
+        if ModernSplashScreen._family is None:
+            ModernSplashScreen._family = 'Inter' if QFont('Inter').exactMatch() else 'Segoe UI'
+        return ModernSplashScreen._family
+
+    @staticmethod
+    def _frame_paths():
+        """Path latar dan bingkai splash, dibangun sekali per proses."""
+        if ModernSplashScreen._outer_path is None:
+            outer = QPainterPath()
+            outer.addRoundedRect(0, 0, 480, 320, 12, 12)
+            inner = QPainterPath()
+            inner.addRoundedRect(1, 1, 478, 318, 12, 12)
+            ModernSplashScreen._outer_path, ModernSplashScreen._inner_path = outer, inner
+        return ModernSplashScreen._outer_path, ModernSplashScreen._inner_path
+
+    @staticmethod
+    def _corner_mask() -> QBitmap:
+        """Mask 1-bit untuk sudut membulat; pixmap sendiri tetap opak."""
+        outer_path, _ = ModernSplashScreen._frame_paths()
+        mask = QBitmap(480, 320)
+        mask.fill(Qt.GlobalColor.color0)
+        painter = QPainter(mask)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(Qt.GlobalColor.color1)
+        painter.drawPath(outer_path)
+        painter.end()
+        return mask
+
+    @staticmethod
+    def _render_pixmap() -> QPixmap:
+        family = ModernSplashScreen._pick_family()
+        _, inner_path = ModernSplashScreen._frame_paths()
         pixmap = QPixmap(480, 320)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        pixmap.fill(QColor(13, 13, 13))
 
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        painter.setBrush(QColor(13, 13, 13))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, 480, 320, 12, 12)
-
         painter.setPen(QColor(31, 31, 31))
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRoundedRect(1, 1, 478, 318, 12, 12)
+        painter.drawPath(inner_path)
 
         painter.setPen(QColor(229, 229, 229))
-        title_font = QFont('Inter', 22, QFont.Weight.DemiBold)
-        if not title_font.exactMatch():
-            title_font = QFont('Segoe UI', 22, QFont.Weight.DemiBold)
-        painter.setFont(title_font)
+        painter.setFont(QFont(family, 22, QFont.Weight.DemiBold))
         painter.drawText(0, 110, 480, 40, Qt.AlignmentFlag.AlignCenter, "File Permission Checker")
 
-        subtitle_font = QFont('Inter', 12)
-        if not subtitle_font.exactMatch():
-            subtitle_font = QFont('Segoe UI', 12)
-        painter.setFont(subtitle_font)
+        painter.setFont(QFont(family, 12))
         painter.setPen(QColor(115, 115, 115))
         painter.drawText(0, 155, 480, 24, Qt.AlignmentFlag.AlignCenter, "Scan • Analyze • Secure")
 
-        version_font = QFont('Inter', 10)
-        if not version_font.exactMatch():
-            version_font = QFont('Segoe UI', 10)
-        painter.setFont(version_font)
+        painter.setFont(QFont(family, 10))
         painter.setPen(QColor(82, 82, 82))
         painter.drawText(0, 190, 480, 20, Qt.AlignmentFlag.AlignCenter, "v2.0")
 
@@ -65,19 +140,7 @@ class ModernSplashScreen(QSplashScreen):
         painter.drawRoundedRect(140, 240, 200, 4, 2, 2)
 
         painter.end()
-
-        super().__init__(pixmap)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
-        
-        self._progress = 0
-        self._loading_steps = [
-            "Initializing...",
-            "Loading modules...",
-            "Preparing database...",
-            "Setting up security...",
-            "Loading interface...",
-            "Almost ready..."
-        ]
+        return pixmap
 
     def showMessage(self, message: str):
         super().showMessage(
@@ -86,28 +149,24 @@ class ModernSplashScreen(QSplashScreen):
             QColor(115, 115, 115)
         )
 
+def minify_qss(qss: str) -> str:
+    """Buang komentar dan spasi berlebih agar parser CSS Qt memproses teks sesedikit mungkin."""
+    qss = _QSS_COMMENT.sub('', qss)
+    qss = _QSS_SPACE.sub(' ', qss)
+    return _QSS_PUNCT_SPACE.sub(r'\1', qss).strip()
+
 def load_styles(app: QApplication):
+    global _STYLES_APPLIED
+    if _STYLES_APPLIED:
+        return
     style_path = os.path.join(os.path.dirname(__file__), 'style.qss')
 
     if os.path.exists(style_path):
-        with open(style_path, 'r') as f:
-            app.setStyleSheet(f.read())
+        with open(style_path, 'r', encoding='utf-8') as f:
+            app.setStyleSheet(minify_qss(f.read()))
     else:
-        app.setStyleSheet("""
-            QMainWindow { background-color:
-            QWidget { color:
-            QPushButton {
-                background:
-                border: 1px solid
-                border-radius: 6px;
-                padding: 10px 20px;
-                color:
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background:
-            }
-        """)
+        app.setStyleSheet(_FALLBACK_QSS)
+    _STYLES_APPLIED = True
 
 def main():
     # PyQt6 handles High DPI scaling automatically
@@ -118,40 +177,32 @@ def main():
 
     splash = ModernSplashScreen()
     splash.show()
-    app.processEvents()
-
-    import time
-    
-    splash.showMessage("Initializing...")
-    app.processEvents()
-    time.sleep(0.4)
-    
-    splash.showMessage("Loading modules...")
-    app.processEvents()
-    time.sleep(0.3)
-
-    load_styles(app)
-    
-    splash.showMessage("Preparing database...")
-    app.processEvents()
-    time.sleep(0.3)
-    
-    splash.showMessage("Setting up security...")
-    app.processEvents()
-    time.sleep(0.3)
-
-    splash.showMessage("Loading interface...")
-    app.processEvents()
-    time.sleep(0.4)
-
-    window = FilePermissionChecker()
-    
-    splash.showMessage("Ready!")
-    app.processEvents()
-    time.sleep(0.3)
-    
-    window.show()
-    splash.finish(window)
+
+    window = None
+
+    def build_window():
+        nonlocal window
+        # Diimpor setelah splash tampil: modul UI menarik seluruh paket core/ui.
+        from ui.main_window import FilePermissionChecker
+        window = FilePermissionChecker()
+
+    steps = [
+        ("Loading styles...", lambda: load_styles(app)),
+        ("Loading interface...", build_window),
+    ]
+
+    def run_step(index: int = 0):
+        # Tiap langkah dijadwalkan lewat event loop, jadi splash tetap dilukis di antaranya.
+        if index == len(steps):
+            splash.showMessage("Ready!")
+            window.show()
+            splash.finish(window)
+            return
+        message, step = steps[index]
+        splash.showMessage(message)
+        QTimer.singleShot(0, lambda: (step(), run_step(index + 1)))
+
+    QTimer.singleShot(0, run_step)
 
     sys.exit(app.exec())
 
@@ -1,22 +1,39 @@
-from ui.modern_widgets import (
-    GlassCard, ModernButton, AnimatedProgressBar, PillBadge,
-    ModernTableWidget, RiskTableWidgetItem, StatCard,
-    ToastNotification, LoadingSpinner, ModernLineEdit
-)
-from ui.widget import StatusLabel, ColoredProgressBar, RiskTableWidgetItem as LegacyRiskItem
+import importlib
 
-__all__ = [
-    'GlassCard',
-    'ModernButton', 
-    'AnimatedProgressBar',
-    'PillBadge',
-    'ModernTableWidget',
-    'RiskTableWidgetItem',
-    'StatCard',
-    'ToastNotification',
-    'LoadingSpinner',
-    'ModernLineEdit',
-    'StatusLabel',
-    'ColoredProgressBar',
-    'LegacyRiskItem'
-]
+# Re-export malas (PEP 562): submodul baru dimuat saat nama pertama kali diakses.
+_LAZY = {
+    'GlassCard': ('ui.modern_widgets', 'GlassCard'),
+    'ModernButton': ('ui.modern_widgets', 'ModernButton'),
+    'AnimatedProgressBar': ('ui.modern_widgets', 'AnimatedProgressBar'),
+    'PillBadge': ('ui.modern_widgets', 'PillBadge'),
+    'ModernTableWidget': ('ui.modern_widgets', 'ModernTableWidget'),
+    'ModernTableView': ('ui.modern_widgets', 'ModernTableView'),
+    'ScanResultsModel': ('ui.modern_widgets', 'ScanResultsModel'),
+    'ScanFilterProxyModel': ('ui.modern_widgets', 'ScanFilterProxyModel'),
+    'RiskTableWidgetItem': ('ui.modern_widgets', 'RiskTableWidgetItem'),
+    'StatCard': ('ui.modern_widgets', 'StatCard'),
+    'ToastNotification': ('ui.modern_widgets', 'ToastNotification'),
+    'LoadingSpinner': ('ui.modern_widgets', 'LoadingSpinner'),
+    'ModernLineEdit': ('ui.modern_widgets', 'ModernLineEdit'),
+    'PermissionBitGrid': ('ui.modern_widgets', 'PermissionBitGrid'),
+    'StaticTextLabel': ('ui.modern_widgets', 'StaticTextLabel'),
+    'StatusLabel': ('ui.widget', 'StatusLabel'),
+    'ColoredProgressBar': ('ui.widget', 'ColoredProgressBar'),
+    'LegacyRiskItem': ('ui.widget', 'RiskTableWidgetItem'),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
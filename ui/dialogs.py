@@ -1,11 +1,193 @@
+from collections import deque
+
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QCheckBox, QGroupBox, QGridLayout, QDialogButtonBox,
-    QTextEdit, QComboBox, QRadioButton, QButtonGroup, QFrame,
-    QWidget, QGraphicsDropShadowEffect
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QCheckBox, QGroupBox, QGridLayout, QWidget, QMessageBox
+)
+from PyQt6.QtCore import QTimer
+
+from ui.modern_widgets import PermissionBitGrid, StaticTextLabel
+
+
+# Satu stylesheet untuk semua dialog; widget memilih gaya lewat properti "class"
+# (seperti style.qss), jadi tiap dialog hanya sekali di-parse dan di-polish.
+DIALOG_QSS = """
+    QDialog {
+        background: #141414;
+        border: 1px solid #262626;
+        border-radius: 8px;
+    }
+    QLabel {
+        color: #d4d4d4;
+    }
+    QLabel[class="dialogHeader"] {
+        font-size: 16px;
+        font-weight: 600;
+        color: #e5e5e5;
+        margin-bottom: 8px;
+    }
+    QLabel[class="fieldLabel"] {
+        font-weight: 500;
+        color: #a3a3a3;
+        font-size: 12px;
+    }
+    QLabel[class="rowLabel"] {
+        font-weight: 500;
+    }
+    QLabel[class="success"] {
+        font-weight: 500;
+        color: #4ade80;
+    }
+    QLabel[class="warning"] {
+        font-weight: 500;
+        color: #fbbf24;
+    }
+    QLabel[class="danger"] {
+        font-weight: 500;
+        color: #f87171;
+    }
+    QLabel[class="badge"] {
+        background: #262626;
+        padding: 4px 12px;
+        border-radius: 4px;
+        color: #a3a3a3;
+        font-weight: 500;
+        font-size: 12px;
+    }
+    QLabel[class="mono"] {
+        background: #1a1a1a;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-family: 'JetBrains Mono', monospace;
+        font-weight: 500;
+        color: #e5e5e5;
+    }
+    QLineEdit {
+        background: #0d0d0d;
+        border: 1px solid #262626;
+        border-radius: 6px;
+        padding: 10px 14px;
+        color: #e5e5e5;
+        font-size: 13px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #525252;
+    }
+    QLineEdit:hover {
+        border: 1px solid #333333;
+    }
+    QCheckBox {
+        color: #e5e5e5;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 4px;
+        border: 1px solid #404040;
+        background: #1a1a1a;
+    }
+    QCheckBox::indicator:hover {
+        border: 1px solid #525252;
+    }
+    QCheckBox::indicator:checked {
+        background: #525252;
+        border: 1px solid #525252;
+    }
+    QGroupBox {
+        background: #1a1a1a;
+        border: 1px solid #262626;
+        border-radius: 6px;
+        margin-top: 16px;
+        padding: 16px 12px 12px 12px;
+        font-weight: 500;
+        color: #e5e5e5;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: 12px;
+        top: 4px;
+        padding: 4px 10px;
+        background: #262626;
+        border-radius: 4px;
+        color: #e5e5e5;
+        font-size: 12px;
+    }
+    QPushButton {
+        background: #404040;
+        border: 1px solid #525252;
+        border-radius: 6px;
+        padding: 10px 20px;
+        color: #ffffff;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background: #525252;
+    }
+    QPushButton:pressed {
+        background: #333333;
+    }
+    QPushButton:disabled {
+        background: #1a1a1a;
+        color: #525252;
+    }
+    QPushButton[class="secondary"] {
+        background: transparent;
+        border: 1px solid #333333;
+        color: #a3a3a3;
+    }
+    QPushButton[class="secondary"]:hover {
+        background: #1f1f1f;
+    }
+    QPushButton[class="preset"] {
+        background: #1a1a1a;
+        border: 1px solid #262626;
+        color: #a3a3a3;
+        padding: 8px 12px;
+        font-size: 11px;
+    }
+    QPushButton[class="preset"]:hover {
+        background: #262626;
+        color: #e5e5e5;
+    }
+"""
+
+PERMISSION_PRESETS = (
+    ("644 - Regular", "644"),
+    ("755 - Executable", "755"),
+    ("600 - Private", "600"),
+    ("640 - Group Read", "640"),
+    ("750 - Group Exec", "750"),
+    ("777 - Full Access", "777"),
+    ("444 - Read Only", "444"),
+    ("711 - Exec Only", "711"),
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QColor, QFont
+
+
+def _digit_symbolic(digit: int) -> str:
+    return ('r' if digit & 4 else '-') + ('w' if digit & 2 else '-') + ('x' if digit & 1 else '-')
+
+
+# Semua 512 kombinasi oktal "000".."777" -> "rwxrwxrwx", dihitung sekali saat import.
+_OCTAL_TO_SYMBOLIC = {
+    f"{u}{g}{o}": _digit_symbolic(u) + _digit_symbolic(g) + _digit_symbolic(o)
+    for u in range(8) for g in range(8) for o in range(8)
+}
+
+# Opsi operasi: (kunci settings, judul di preview, teks checkbox, default).
+PERMISSION_OPTIONS = (
+    ('backup', "Backup", "Create backup before changes", True),
+    ('encrypt', "Encrypt", "Encrypt files after changes", False),
+    ('verify', "Verify", "Verify integrity with hash", True),
+    ('recursive', "Recursive", "Apply recursively to subdirectories", False),
+)
+
+# Riwayat izin dibatasi; entri tertua dibuang otomatis oleh deque.
+PERMISSION_HISTORY_LIMIT = 64
+
+# Indeks = 9 bit izin (0..511) -> string oktal tiga digit.
+_BITS_TO_OCTAL = tuple(f"{(b >> 6) & 7}{(b >> 3) & 7}{b & 7}" for b in range(512))
 
 
 class ModernDialog(QDialog):
@@ -18,86 +200,7 @@ class ModernDialog(QDialog):
         self._apply_base_style()
     
     def _apply_base_style(self):
-        self.setStyleSheet("""
-            QDialog {
-                background:
-                border: 1px solid
-                border-radius: 8px;
-            }
-            QLabel {
-                color:
-            }
-            QLineEdit {
-                background:
-                border: 1px solid
-                border-radius: 6px;
-                padding: 10px 14px;
-                color:
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid
-            }
-            QLineEdit:hover {
-                border: 1px solid
-            }
-            QCheckBox {
-                color:
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 1px solid
-                background:
-            }
-            QCheckBox::indicator:hover {
-                border: 1px solid
-            }
-            QCheckBox::indicator:checked {
-                background:
-                border: 1px solid
-            }
-            QGroupBox {
-                background:
-                border: 1px solid
-                border-radius: 6px;
-                margin-top: 16px;
-                padding: 16px 12px 12px 12px;
-                font-weight: 500;
-                color:
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 12px;
-                top: 4px;
-                padding: 4px 10px;
-                background:
-                border-radius: 4px;
-                color:
-                font-size: 12px;
-            }
-            QPushButton {
-                background:
-                border: 1px solid
-                border-radius: 6px;
-                padding: 10px 20px;
-                color:
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background:
-            }
-            QPushButton:pressed {
-                background:
-            }
-            QPushButton:disabled {
-                background:
-                color:
-            }
-        """)
+        self.setStyleSheet(DIALOG_QSS)
 
 
 class PasswordDialog(ModernDialog):
@@ -114,16 +217,11 @@ class PasswordDialog(ModernDialog):
         layout.setSpacing(16)
         
         header = QLabel(self.windowTitle())
-        header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color:
-            margin-bottom: 8px;
-        """)
+        header.setProperty("class", "dialogHeader")
         layout.addWidget(header)
         
         pass_label = QLabel("Password")
-        pass_label.setStyleSheet("font-weight: 500; color: #a3a3a3; font-size: 12px;")
+        pass_label.setProperty("class", "fieldLabel")
         layout.addWidget(pass_label)
         
         self.password_input = QLineEdit()
@@ -133,7 +231,7 @@ class PasswordDialog(ModernDialog):
         layout.addWidget(self.password_input)
         
         confirm_label = QLabel("Confirm Password")
-        confirm_label.setStyleSheet("font-weight: 500; color: #a3a3a3; font-size: 12px;")
+        confirm_label.setProperty("class", "fieldLabel")
         layout.addWidget(confirm_label)
         
         self.confirm_input = QLineEdit()
@@ -152,16 +250,7 @@ class PasswordDialog(ModernDialog):
         btn_layout.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background:
-                border: 1px solid
-                color:
-            }
-            QPushButton:hover {
-                background:
-            }
-        """)
+        cancel_btn.setProperty("class", "secondary")
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
         
@@ -194,7 +283,7 @@ class AdvancedPermissionDialog(ModernDialog):
         self.setMinimumWidth(560)
         self.file_count = file_count
         
-        self.permission_history = []
+        self.permission_history = deque(maxlen=PERMISSION_HISTORY_LIMIT)
         self.current_history_index = -1
         
         self.init_ui()
@@ -207,92 +296,32 @@ class AdvancedPermissionDialog(ModernDialog):
         header_layout = QHBoxLayout()
         
         header = QLabel("Permission Settings")
-        header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color:
-        """)
+        header.setProperty("class", "dialogHeader")
         header_layout.addWidget(header)
         
         file_count_badge = QLabel(f"{self.file_count} file(s)")
-        file_count_badge.setStyleSheet("""
-            background:
-            padding: 4px 12px;
-            border-radius: 4px;
-            color:
-            font-weight: 500;
-            font-size: 12px;
-        """)
+        file_count_badge.setProperty("class", "badge")
         header_layout.addWidget(file_count_badge)
         header_layout.addStretch()
         
         layout.addLayout(header_layout)
         
         self.visual_editor_group = QGroupBox("Visual Editor")
-        visual_layout = QGridLayout()
-        visual_layout.setSpacing(12)
-        
-        visual_layout.addWidget(QLabel(""), 0, 0)
-        
-        read_header = QLabel("Read")
-        read_header.setStyleSheet("font-weight: 500; color: #4ade80;")
-        visual_layout.addWidget(read_header, 0, 1, Qt.AlignmentFlag.AlignCenter)
-        
-        write_header = QLabel("Write")
-        write_header.setStyleSheet("font-weight: 500; color: #fbbf24;")
-        visual_layout.addWidget(write_header, 0, 2, Qt.AlignmentFlag.AlignCenter)
-        
-        exec_header = QLabel("Execute")
-        exec_header.setStyleSheet("font-weight: 500; color: #f87171;")
-        visual_layout.addWidget(exec_header, 0, 3, Qt.AlignmentFlag.AlignCenter)
+        visual_layout = QHBoxLayout()
         
-        user_label = QLabel("Owner")
-        user_label.setStyleSheet("font-weight: 500;")
-        visual_layout.addWidget(user_label, 1, 0)
-        
-        self.user_read = QCheckBox()
-        self.user_read.setChecked(True)
-        self.user_write = QCheckBox()
-        self.user_write.setChecked(True)
-        self.user_execute = QCheckBox()
-        
-        visual_layout.addWidget(self.user_read, 1, 1, Qt.AlignmentFlag.AlignCenter)
-        visual_layout.addWidget(self.user_write, 1, 2, Qt.AlignmentFlag.AlignCenter)
-        visual_layout.addWidget(self.user_execute, 1, 3, Qt.AlignmentFlag.AlignCenter)
-        
-        group_label = QLabel("Group")
-        group_label.setStyleSheet("font-weight: 500;")
-        visual_layout.addWidget(group_label, 2, 0)
-        
-        self.group_read = QCheckBox()
-        self.group_read.setChecked(True)
-        self.group_write = QCheckBox()
-        self.group_execute = QCheckBox()
-        
-        visual_layout.addWidget(self.group_read, 2, 1, Qt.AlignmentFlag.AlignCenter)
-        visual_layout.addWidget(self.group_write, 2, 2, Qt.AlignmentFlag.AlignCenter)
-        visual_layout.addWidget(self.group_execute, 2, 3, Qt.AlignmentFlag.AlignCenter)
-        
-        others_label = QLabel("Others")
-        others_label.setStyleSheet("font-weight: 500;")
-        visual_layout.addWidget(others_label, 3, 0)
-        
-        self.others_read = QCheckBox()
-        self.others_read.setChecked(True)
-        self.others_write = QCheckBox()
-        self.others_execute = QCheckBox()
-        
-        visual_layout.addWidget(self.others_read, 3, 1, Qt.AlignmentFlag.AlignCenter)
-        visual_layout.addWidget(self.others_write, 3, 2, Qt.AlignmentFlag.AlignCenter)
-        visual_layout.addWidget(self.others_execute, 3, 3, Qt.AlignmentFlag.AlignCenter)
+        self.bit_grid = PermissionBitGrid(0o644)
+        visual_layout.addWidget(self.bit_grid)
+        visual_layout.addStretch()
         
         self.visual_editor_group.setLayout(visual_layout)
         layout.addWidget(self.visual_editor_group)
         
-        for checkbox in [self.user_read, self.user_write, self.user_execute,
-                        self.group_read, self.group_write, self.group_execute,
-                        self.others_read, self.others_write, self.others_execute]:
-            checkbox.stateChanged.connect(self.update_permission_from_visual)
+        # Beberapa klik dalam satu putaran event loop digabung jadi satu update.
+        self._visual_update_timer = QTimer(self)
+        self._visual_update_timer.setSingleShot(True)
+        self._visual_update_timer.setInterval(0)
+        self._visual_update_timer.timeout.connect(self._apply_permission_from_visual)
+        self.bit_grid.bitsChanged.connect(self.update_permission_from_visual)
         
         octal_group = QGroupBox("Octal Permission")
         octal_layout = QHBoxLayout()
@@ -301,110 +330,36 @@ class AdvancedPermissionDialog(ModernDialog):
         self.permission_input = QLineEdit("644")
         self.permission_input.setPlaceholderText("e.g., 644, 755, 600")
         self.permission_input.setMaximumWidth(120)
+        self.permission_input.setMaxLength(3)
         self.permission_input.textChanged.connect(self.update_visual_from_permission)
         octal_layout.addWidget(self.permission_input)
         
-        self.symbolic_label = QLabel("rw-r--r--")
-        self.symbolic_label.setStyleSheet("""
-            background:
-            padding: 6px 12px;
-            border-radius: 4px;
-            font-family: 'JetBrains Mono', monospace;
-            font-weight: 500;
-            color:
-        """)
+        self.symbolic_label = StaticTextLabel("rw-r--r--", widest="rwxrwxrwx")
+        self.symbolic_label.setProperty("class", "mono")
         octal_layout.addWidget(self.symbolic_label)
         octal_layout.addStretch()
         
         octal_group.setLayout(octal_layout)
         layout.addWidget(octal_group)
         
-        presets_group = QGroupBox("Quick Presets")
-        presets_layout = QGridLayout()
-        presets_layout.setSpacing(8)
-        
-        presets = [
-            ("644 - Regular", "644"),
-            ("755 - Executable", "755"),
-            ("600 - Private", "600"),
-            ("640 - Group Read", "640"),
-            ("750 - Group Exec", "750"),
-            ("777 - Full Access", "777"),
-            ("444 - Read Only", "444"),
-            ("711 - Exec Only", "711")
-        ]
-        
-        for i, (label, perm) in enumerate(presets):
-            btn = QPushButton(label)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background:
-                    border: 1px solid
-                    color:
-                    padding: 8px 12px;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background:
-                    color:
-                }
-            """)
-            btn.clicked.connect(lambda checked, p=perm: self.set_permission(p))
-            presets_layout.addWidget(btn, i // 4, i % 4)
-        
-        presets_group.setLayout(presets_layout)
-        layout.addWidget(presets_group)
-        
-        options_group = QGroupBox("Options")
-        options_layout = QVBoxLayout()
-        options_layout.setSpacing(8)
-        
-        self.backup_checkbox = QCheckBox("Create backup before changes")
-        self.backup_checkbox.setChecked(True)
-        options_layout.addWidget(self.backup_checkbox)
-        
-        self.encrypt_checkbox = QCheckBox("Encrypt files after changes")
-        options_layout.addWidget(self.encrypt_checkbox)
-        
-        self.verify_checkbox = QCheckBox("Verify integrity with hash")
-        self.verify_checkbox.setChecked(True)
-        options_layout.addWidget(self.verify_checkbox)
-        
-        self.recursive_checkbox = QCheckBox("Apply recursively to subdirectories")
-        options_layout.addWidget(self.recursive_checkbox)
-        
-        options_group.setLayout(options_layout)
-        layout.addWidget(options_group)
+        # Preset dan opsi dibangun setelah dialog tampil (lihat _build_deferred).
+        self._presets_placeholder = QWidget()
+        layout.addWidget(self._presets_placeholder)
+        self._options_placeholder = QWidget()
+        layout.addWidget(self._options_placeholder)
+        self._deferred_built = False
         
         btn_layout = QHBoxLayout()
         
         preview_btn = QPushButton("Preview")
-        preview_btn.setStyleSheet("""
-            QPushButton {
-                background:
-                border: 1px solid
-                color:
-            }
-            QPushButton:hover {
-                background:
-            }
-        """)
+        preview_btn.setProperty("class", "secondary")
         preview_btn.clicked.connect(self.preview)
         btn_layout.addWidget(preview_btn)
         
         btn_layout.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background:
-                border: 1px solid
-                color:
-            }
-            QPushButton:hover {
-                background:
-            }
-        """)
+        cancel_btn.setProperty("class", "secondary")
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
         
@@ -415,62 +370,64 @@ class AdvancedPermissionDialog(ModernDialog):
         layout.addLayout(btn_layout)
         
         self.update_visual_from_permission("644")
+        QTimer.singleShot(0, self._build_deferred)
     
-    def update_permission_from_visual(self):
-        user = (4 if self.user_read.isChecked() else 0) + \
-               (2 if self.user_write.isChecked() else 0) + \
-               (1 if self.user_execute.isChecked() else 0)
+    def _build_deferred(self):
+        """Bangun grup Quick Presets dan Options; aman dipanggil lebih dari sekali."""
+        if self._deferred_built:
+            return
+        self._deferred_built = True
+        layout = self.layout()
         
-        group = (4 if self.group_read.isChecked() else 0) + \
-                (2 if self.group_write.isChecked() else 0) + \
-                (1 if self.group_execute.isChecked() else 0)
+        presets_group = QGroupBox("Quick Presets")
+        presets_layout = QGridLayout()
+        presets_layout.setSpacing(8)
+        
+        for i, (label, perm) in enumerate(PERMISSION_PRESETS):
+            btn = QPushButton(label)
+            btn.setProperty("class", "preset")
+            btn.clicked.connect(lambda checked, p=perm: self.set_permission(p))
+            presets_layout.addWidget(btn, i // 4, i % 4)
+        
+        presets_group.setLayout(presets_layout)
+        layout.replaceWidget(self._presets_placeholder, presets_group)
+        self._presets_placeholder.deleteLater()
         
-        others = (4 if self.others_read.isChecked() else 0) + \
-                 (2 if self.others_write.isChecked() else 0) + \
-                 (1 if self.others_execute.isChecked() else 0)
+        options_group = QGroupBox("Options")
+        options_layout = QVBoxLayout()
+        options_layout.setSpacing(8)
         
-        permission = f"{user}{group}{others}"
+        self._options = {}
+        for key, _, text, checked in PERMISSION_OPTIONS:
+            checkbox = QCheckBox(text)
+            checkbox.setChecked(checked)
+            options_layout.addWidget(checkbox)
+            self._options[key] = checkbox
+        
+        options_group.setLayout(options_layout)
+        layout.replaceWidget(self._options_placeholder, options_group)
+        self._options_placeholder.deleteLater()
+    
+    def update_permission_from_visual(self, bits: int = None):
+        self._visual_update_timer.start()
+    
+    def _apply_permission_from_visual(self):
+        permission = _BITS_TO_OCTAL[self.bit_grid.bits()]
         
         self.permission_input.blockSignals(True)
         self.permission_input.setText(permission)
         self.permission_input.blockSignals(False)
         
-        self.symbolic_label.setText(self.get_symbolic_permission(permission))
+        self.symbolic_label.setText(_OCTAL_TO_SYMBOLIC[permission])
         self.add_to_history(permission)
     
     def update_visual_from_permission(self, permission: str):
-        if len(permission) != 3 or not permission.isdigit():
+        # Kunci tabel hanya "000".."777", jadi satu cek ini juga menolak digit 8/9.
+        if permission not in _OCTAL_TO_SYMBOLIC:
             return
         
-        try:
-            for checkbox in [self.user_read, self.user_write, self.user_execute,
-                           self.group_read, self.group_write, self.group_execute,
-                           self.others_read, self.others_write, self.others_execute]:
-                checkbox.blockSignals(True)
-            
-            user = int(permission[0])
-            group = int(permission[1])
-            others = int(permission[2])
-            
-            self.user_read.setChecked(bool(user & 4))
-            self.user_write.setChecked(bool(user & 2))
-            self.user_execute.setChecked(bool(user & 1))
-            
-            self.group_read.setChecked(bool(group & 4))
-            self.group_write.setChecked(bool(group & 2))
-            self.group_execute.setChecked(bool(group & 1))
-            
-            self.others_read.setChecked(bool(others & 4))
-            self.others_write.setChecked(bool(others & 2))
-            self.others_execute.setChecked(bool(others & 1))
-            
-            self.symbolic_label.setText(self.get_symbolic_permission(permission))
-            
-        finally:
-            for checkbox in [self.user_read, self.user_write, self.user_execute,
-                           self.group_read, self.group_write, self.group_execute,
-                           self.others_read, self.others_write, self.others_execute]:
-                checkbox.blockSignals(False)
+        self.bit_grid.setBits(int(permission, 8))
+        self.symbolic_label.setText(_OCTAL_TO_SYMBOLIC[permission])
     
     def set_permission(self, permission: str):
         self.permission_input.setText(permission)
@@ -481,15 +438,20 @@ class AdvancedPermissionDialog(ModernDialog):
         if self.permission_history and self.permission_history[-1] == permission:
             return
         
-        self.permission_history = self.permission_history[:self.current_history_index + 1]
+        # Buang ekor "redo" di tempat, tanpa menyalin list.
+        while len(self.permission_history) > self.current_history_index + 1:
+            self.permission_history.pop()
         self.permission_history.append(permission)
         self.current_history_index = len(self.permission_history) - 1
     
     def preview(self):
+        self._build_deferred()
         permission = self.permission_input.text()
         symbolic = self.get_symbolic_permission(permission)
-        
-        from PyQt6.QtWidgets import QMessageBox
+        options = "\n".join(
+            f"• {title}: {'✅ Yes' if self._options[key].isChecked() else '❌ No'}"
+            for key, title, _, _ in PERMISSION_OPTIONS
+        )
         
         msg = QMessageBox(self)
         msg.setWindowTitle("Preview")
@@ -501,36 +463,21 @@ class AdvancedPermissionDialog(ModernDialog):
 📁 Files: {self.file_count} file(s)
 
 ⚙️ Options:
-• Backup: {'✅ Yes' if self.backup_checkbox.isChecked() else '❌ No'}
-• Encrypt: {'✅ Yes' if self.encrypt_checkbox.isChecked() else '❌ No'}
-• Verify: {'✅ Yes' if self.verify_checkbox.isChecked() else '❌ No'}
-• Recursive: {'✅ Yes' if self.recursive_checkbox.isChecked() else '❌ No'}
+{options}
 
 ⚠️ Note: Changes cannot be undone automatically.
         """)
         msg.exec()
     
     def get_symbolic_permission(self, permission: str) -> str:
-        if len(permission) != 3:
-            return "Invalid"
-        
-        symbolic = ""
-        for digit in permission:
-            num = int(digit)
-            symbolic += 'r' if num & 4 else '-'
-            symbolic += 'w' if num & 2 else '-'
-            symbolic += 'x' if num & 1 else '-'
-        
-        return symbolic
+        return _OCTAL_TO_SYMBOLIC.get(permission, "Invalid")
     
     def get_settings(self) -> dict:
-        return {
-            'permission': self.permission_input.text(),
-            'backup': self.backup_checkbox.isChecked(),
-            'encrypt': self.encrypt_checkbox.isChecked(),
-            'verify': self.verify_checkbox.isChecked(),
-            'recursive': self.recursive_checkbox.isChecked()
-        }
+        self._build_deferred()
+        settings = {'permission': self.permission_input.text()}
+        for key, checkbox in self._options.items():
+            settings[key] = checkbox.isChecked()
+        return settings
 
 
 class SettingsDialog(ModernDialog):
@@ -547,12 +494,7 @@ class SettingsDialog(ModernDialog):
         layout.setSpacing(12)
         
         header = QLabel("Settings")
-        header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: 600;
-            color:
-            margin-bottom: 8px;
-        """)
+        header.setProperty("class", "dialogHeader")
         layout.addWidget(header)
         
         theme_group = QGroupBox("Theme")
@@ -617,16 +559,7 @@ class SettingsDialog(ModernDialog):
         btn_layout.addStretch()
         
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background:
-                border: 1px solid
-                color:
-            }
-            QPushButton:hover {
-                background:
-            }
-        """)
+        cancel_btn.setProperty("class", "secondary")
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
         
@@ -31,22 +31,25 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer, QSize
 from PyQt6.QtGui import QColor, QFont, QKeySequence, QShortcut, QDragEnterEvent, QDropEvent, QIcon
 
-from core.scanner import ScanThread
+from core.scanner import ScanThread, ScanResults, RISK_LEVELS
 from core.permission_fixer import PermissionFixer
 from core.integrity import IntegrityManager
-from core.database import init_database, log_scan
+from core.database import init_database, log_scan_in_background
 from core.encryption_manager import EncryptionWorker
 from core.backup import BackupManager
 from core.security import SecurityManager
 
 from ui.modern_widgets import (
     GlassCard, ModernButton, AnimatedProgressBar,
-    ModernTableWidget, RiskTableWidgetItem, ToastNotification,
-    PillBadge
+    ModernTableWidget, ModernTableView, ToastNotification,
+    PillBadge, ScanResultsModel, ScanFilterProxyModel
 )
 from ui.dialogs import AdvancedPermissionDialog
 from utils.constants import CUSTOM_RULES
-from utils.helpers import format_size
+from utils.helpers import format_size, format_mode, expand_file_info
+
+# Jeda sebelum filter pencarian dijalankan ulang saat mengetik.
+SEARCH_DEBOUNCE_MS = 150
 
 
 class FilePermissionChecker(QMainWindow):
@@ -54,7 +57,7 @@ class FilePermissionChecker(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.all_files = []
+        self.all_files = ScanResults()
         self.scan_cache = {}
         self.dark_mode = True
         
@@ -276,6 +279,11 @@ class FilePermissionChecker(QMainWindow):
         browse_btn.clicked.connect(self.browse_path)
         top_layout.addWidget(browse_btn)
         
+        self.include_hidden_check = QCheckBox("Include hidden")
+        self.include_hidden_check.setChecked(True)
+        self.include_hidden_check.setToolTip("Also scan dot-folders (.ssh and .gnupg are always scanned)")
+        top_layout.addWidget(self.include_hidden_check)
+        
         scan_btn = ModernButton("Analyze Folder", style="primary")
         scan_btn.setToolTip("Scan folder for permission vulnerabilities (Ctrl+S or F5)")
         scan_btn.clicked.connect(self.start_scan)
@@ -288,17 +296,16 @@ class FilePermissionChecker(QMainWindow):
         self.progress_bar.setFixedHeight(26)
         scan_layout.addWidget(self.progress_bar)
         
-        self.file_table = ModernTableWidget()
-        self.file_table.setColumnCount(8)
-        self.file_table.setHorizontalHeaderLabels([
-            "📄 Name", "📁 Path", "🔢 Mode", "🔣 Symbolic", 
-            "⚠️ Risk", "🎯 Expected", "📊 Size", "📅 Modified"
-        ])
+        self.file_model = ScanResultsModel(self.all_files, self)
+        self.file_proxy = ScanFilterProxyModel(self)
+        self.file_proxy.setSourceModel(self.file_model)
+        self.file_table = ModernTableView()
+        self.file_table.setModel(self.file_proxy)
         self.file_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.file_table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.file_table.setSortingEnabled(True)
         self.file_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.file_table.itemSelectionChanged.connect(self.update_selection_count)
+        self.file_table.selectionModel().selectionChanged.connect(self.update_selection_count)
         scan_layout.addWidget(self.file_table, 1)
         
         bottom_card = GlassCard()
@@ -323,7 +330,11 @@ class FilePermissionChecker(QMainWindow):
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search files...")
-        self.search_input.textChanged.connect(self.apply_filter)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.apply_filter)
+        self.search_input.textChanged.connect(self._search_timer.start)
         self.search_input.setMinimumWidth(200)
         bottom_layout.addWidget(self.search_input)
         
@@ -803,15 +814,17 @@ class FilePermissionChecker(QMainWindow):
         
         self.integrity_manager.log_audit_event('scan_started', file_path=folderpath, details=f"Scan initiated for folder: {folderpath}")
         
-        self.all_files = []
-        self.file_table.setRowCount(0)
+        self.all_files = ScanResults()
+        self.file_model.set_results(self.all_files)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
+        # Jumlah file tidak diketahui sebelum walk selesai: tampilkan bar sibuk.
+        self.progress_bar.setRange(0, 0)
         self.status_bar.showMessage(f"🔍 Scanning {folderpath}...")
         
-        self.scan_thread = ScanThread(folderpath, CUSTOM_RULES)
+        self.scan_thread = ScanThread(folderpath, CUSTOM_RULES,
+                                      include_hidden=self.include_hidden_check.isChecked())
         self.scan_thread.progress.connect(self.update_scan_progress)
-        self.scan_thread.file_found.connect(self.add_file_to_table)
+        self.scan_thread.file_found.connect(self.add_files_to_table)
         self.scan_thread.finished.connect(self.scan_finished)
         self.scan_thread.error.connect(self.scan_error)
         self.scan_thread.start()
@@ -820,27 +833,20 @@ class FilePermissionChecker(QMainWindow):
         self.progress_bar.setValue(progress)
         self.status_bar.showMessage(f"🔍 {message}")
 
-    def add_file_to_table(self, file_data: dict):
-        self.all_files.append(file_data)
-        row = self.file_table.rowCount()
-        self.file_table.insertRow(row)
-        self.file_table.setItem(row, 0, QTableWidgetItem(file_data['name']))
-        self.file_table.setItem(row, 1, QTableWidgetItem(file_data['relative']))
-        self.file_table.setItem(row, 2, QTableWidgetItem(file_data['info']['mode']))
-        self.file_table.setItem(row, 3, QTableWidgetItem(file_data['info']['symbolic']))
-        self.file_table.setItem(row, 4, RiskTableWidgetItem(file_data['risk'], file_data['risk']))
-        self.file_table.setItem(row, 5, QTableWidgetItem(file_data['expected'] or '-'))
-        size_item = QTableWidgetItem(format_size(file_data['info']['size']))
-        size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.file_table.setItem(row, 6, size_item)
-        self.file_table.setItem(row, 7, QTableWidgetItem(file_data['info']['modified'].strftime('%Y-%m-%d %H:%M')))
+    def add_files_to_table(self, batch: list):
+        """Tambahkan satu batch hasil scan ke model tabel."""
+        self.file_model.append_batch(batch)
 
-    def scan_finished(self, files: list, stats: dict):
+    def scan_finished(self, stats: dict):
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setVisible(False)
         self.update_stats(stats)
-        log_scan(self.db_conn, {'folder_path': self.path_input.text(), 'total_files': stats['total_files'], 'total_size': stats['total_size'], 'high_risk': stats['high_risk'], 'medium_risk': stats['medium_risk'], 'low_risk': stats['low_risk']})
+        # Insert per file berjalan di thread lain; self.all_files tidak diubah lagi (scan baru membuat objek baru).
+        log_scan_in_background({'folder_path': self.path_input.text(), 'total_files': stats['total_files'], 'total_size': stats['total_size'], 'high_risk': stats['high_risk'], 'medium_risk': stats['medium_risk'], 'low_risk': stats['low_risk']}, files=self.all_files)
         self.integrity_manager.log_audit_event('scan_completed', file_path=self.path_input.text(), details=f"Scan completed: {len(self.all_files)} files")
-        self.status_bar.showMessage(f"✅ Scan complete: {len(self.all_files):,} files")
+        skipped = stats.get('skipped_dirs', 0)
+        skipped_text = f" • {skipped:,} folders skipped" if skipped else ""
+        self.status_bar.showMessage(f"✅ Scan complete: {len(self.all_files):,} files{skipped_text}")
         self.show_toast(f"Scan complete: {len(self.all_files):,} files", "success")
 
     def update_stats(self, stats: dict):
@@ -856,24 +862,18 @@ class FilePermissionChecker(QMainWindow):
         update_label(self.stat_size, format_size(stats.get('total_size', 0)))
 
     def scan_error(self, error: str):
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setVisible(False)
         self.show_toast(f"Scan error: {error}", "error")
 
     def apply_filter(self):
         filter_text = self.filter_combo.currentText()
-        search_text = self.search_input.text().lower()
-        for row in range(self.file_table.rowCount()):
-            show_row = True
-            if "All" not in filter_text:
-                risk_item = self.file_table.item(row, 4)
-                if risk_item and filter_text.split(" ")[1] not in risk_item.text(): show_row = False
-            if show_row and search_text:
-                if search_text not in self.file_table.item(row, 0).text().lower() and search_text not in self.file_table.item(row, 1).text().lower(): show_row = False
-            self.file_table.setRowHidden(row, not show_row)
+        risk_level = None if "All" in filter_text else filter_text.split(" ")[1]
+        self.file_proxy.set_filter(risk_level, self.search_input.text())
 
     def update_selection_count(self):
         """Update selection count label and fix button with quantitative feedback."""
-        count = len(set(item.row() for item in self.file_table.selectedItems()))
+        count = len(self.file_table.selectionModel().selectedRows())
         self.selected_count_label.setText(f"Selected: {count}")
         
         if count > 0:
@@ -882,23 +882,23 @@ class FilePermissionChecker(QMainWindow):
             self.fix_selected_btn.setText("Harden Selected")
 
     def get_selected_files(self) -> List[dict]:
-        selected_rows = set(item.row() for item in self.file_table.selectedItems())
-        return [self.all_files[row] for row in selected_rows if row < len(self.all_files)]
+        rows = self.file_table.selectionModel().selectedRows()
+        return [self.all_files[self.file_proxy.mapToSource(index).row()] for index in rows]
 
     def fix_permissions(self):
         """Perbaiki semua izin berisiko"""
-        risky_files = [f for f in self.all_files if f['risk'] in ['High', 'Medium']]
-        
-        if not risky_files:
+        counts = self.all_files.risk_counts()
+        if not counts['High'] and not counts['Medium']:
             self.show_toast("No risky permissions found! ✅", "success")
             return
+        risky_files = [self.all_files[i] for i in self.all_files.indices_at_risk('Medium')]
         
         msg = QMessageBox(self)
         msg.setWindowTitle('Fix Risky Permissions')
         msg.setText(f"Found {len(risky_files)} files with risky permissions.")
         msg.setInformativeText(
-            f"🔴 High Risk: {sum(1 for f in risky_files if f['risk'] == 'High')}\n"
-            f"⚠️ Medium Risk: {sum(1 for f in risky_files if f['risk'] == 'Medium')}\n\n"
+            f"🔴 High Risk: {counts['High']}\n"
+            f"⚠️ Medium Risk: {counts['Medium']}\n\n"
             "Choose repair method:"
         )
         msg.setIcon(QMessageBox.Icon.Warning)
@@ -982,8 +982,12 @@ class FilePermissionChecker(QMainWindow):
             with open(filename, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow(['Name', 'Path', 'Mode', 'Risk', 'Expected', 'Size', 'Modified'])
-                for fd in self.all_files:
-                    writer.writerow([fd['name'], fd['relative'], fd['info']['mode'], fd['risk'], fd['expected'], fd['info']['size'], fd['info']['modified']])
+                results = self.all_files
+                writer.writerows(zip(
+                    results.names, results.relatives, map(format_mode, results.modes),
+                    (RISK_LEVELS[code] for code in results.risks), results.expected,
+                    results.sizes, map(datetime.fromtimestamp, results.mtimes)
+                ))
             os.chmod(filename, 0o600)
             self._create_checksum(filename)
             self.show_toast("Export successful", "success")
@@ -991,10 +995,11 @@ class FilePermissionChecker(QMainWindow):
 
     def _export_json(self, filename: str):
         try:
+            counts = self.all_files.risk_counts()
             stats = {
-                'high_risk': sum(1 for f in self.all_files if f['risk'] == 'High'),
-                'medium_risk': sum(1 for f in self.all_files if f['risk'] == 'Medium'),
-                'low_risk': sum(1 for f in self.all_files if f['risk'] == 'Low'),
+                'high_risk': counts['High'],
+                'medium_risk': counts['Medium'],
+                'low_risk': counts['Low'],
                 'total_files': len(self.all_files)
             }
             
@@ -1003,14 +1008,16 @@ class FilePermissionChecker(QMainWindow):
                     return obj.isoformat()
                 raise TypeError(f"Type {type(obj)} not serializable")
             
-            data = {
-                'timestamp': datetime.now().isoformat(),
-                'stats': stats,
-                'files': self.all_files
-            }
-            
+            # Ditulis per record (tanpa indent) agar tidak ada salinan kedua seluruh hasil di memori.
+            header = json.dumps({'timestamp': datetime.now().isoformat(), 'stats': stats})
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=json_serial)
+                f.write(header[:-1] + ', "files": [')
+                for i, fd in enumerate(self.all_files):
+                    if i:
+                        f.write(',\n')
+                    fd['info'].update(expand_file_info(fd['info']))
+                    f.write(json.dumps(fd, default=json_serial))
+                f.write(']}\n')
                 
             os.chmod(filename, 0o600)
             self._create_checksum(filename)
@@ -1049,6 +1056,7 @@ class FilePermissionChecker(QMainWindow):
 
     def closeEvent(self, event):
         if hasattr(self, 'db_conn'): self.db_conn.close()
+        self.security_manager.clear_key_cache()
         self.integrity_manager.log_audit_event('application_closed', details='Application closed normally')
         event.accept()
 
@@ -10,20 +10,27 @@ r"""╔════════════════════════
 ║  https://github.com/zuckdorsey                                                       ║
 ╚══════════════════════════════════════════════════════════════════╝"""
 
+import stat
+from datetime import datetime
+
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QProgressBar, QTableWidget,
-    QTableWidgetItem, QVBoxLayout, QHBoxLayout, QFrame,
+    QTableWidgetItem, QTableView, QVBoxLayout, QHBoxLayout, QFrame,
     QGraphicsDropShadowEffect, QSizePolicy, QHeaderView
 )
 from PyQt6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, pyqtProperty,
-    QTimer, QSize, QPoint, QRect
+    Qt, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal,
+    QTimer, QSize, QPoint, QRect,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
 from PyQt6.QtGui import (
     QColor, QFont, QPainter, QPainterPath, QBrush,
-    QLinearGradient, QPen, QIcon
+    QLinearGradient, QPen, QIcon, QStaticText
 )
 
+from core.scanner import RISK_LEVELS, RISK_CODES
+from utils.helpers import format_size, format_mode
+
 
 class GlassCard(QFrame):
     """Minimalist card component"""
@@ -250,33 +257,24 @@ class PillBadge(QLabel):
         self._apply_style()
 
 
-class ModernTableWidget(QTableWidget):
-    """Minimalist table with readable text"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._setup_style()
-        self._setup_headers()
-    
-    def _setup_style(self):
-        self.setStyleSheet("""
-            QTableWidget {
+_TABLE_STYLE = """
+            QTableView {
                 background:
                 border: 1px solid
                 border-radius: 6px;
                 gridline-color:
                 selection-background-color:
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px 8px;
                 border-bottom: 1px solid
                 color:
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background:
                 color:
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background:
             }
             QHeaderView::section {
@@ -294,16 +292,33 @@ class ModernTableWidget(QTableWidget):
             QHeaderView::section:hover {
                 background:
             }
-        """)
-        
-        self.setAlternatingRowColors(False)
-        self.verticalHeader().setVisible(False)
-        self.setShowGrid(False)
+        """
+
+
+def _style_table(table: QTableView):
+    table.setStyleSheet(_TABLE_STYLE)
+    table.setAlternatingRowColors(False)
+    table.verticalHeader().setVisible(False)
+    table.setShowGrid(False)
+    table.horizontalHeader().setStretchLastSection(True)
+    table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+    table.horizontalHeader().setMinimumSectionSize(80)
+
+
+class ModernTableWidget(QTableWidget):
+    """Minimalist table with readable text"""
     
-    def _setup_headers(self):
-        self.horizontalHeader().setStretchLastSection(True)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.horizontalHeader().setMinimumSectionSize(80)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        _style_table(self)
+
+
+class ModernTableView(QTableView):
+    """ModernTableWidget look for model-backed tables"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        _style_table(self)
 
 
 class RiskTableWidgetItem(QTableWidgetItem):
@@ -323,21 +338,157 @@ class RiskTableWidgetItem(QTableWidgetItem):
         }
     }
     
+    # Brush dan font dibuat sekali lalu dibagi ke semua item/baris.
+    BRUSHES = {level: (QBrush(colors['bg']), QBrush(colors['fg'])) for level, colors in COLORS.items()}
+    _font = None
+    
     def __init__(self, text: str, risk_level: str = "Low"):
         super().__init__(text)
         self.risk_level = risk_level
         self._apply_style()
     
+    @classmethod
+    def risk_font(cls) -> QFont:
+        if cls._font is None:
+            cls._font = QFont('Segoe UI', 10)
+            cls._font.setBold(True)
+        return cls._font
+    
     def _apply_style(self):
-        colors = self.COLORS.get(self.risk_level, self.COLORS['Low'])
+        background, foreground = self.BRUSHES.get(self.risk_level, self.BRUSHES['Low'])
         
-        self.setBackground(colors['bg'])
-        self.setForeground(colors['fg'])
+        self.setBackground(background)
+        self.setForeground(foreground)
         self.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setFont(self.risk_font())
+
+
+SORT_ROLE = Qt.ItemDataRole.UserRole
+
+
+class ScanResultsModel(QAbstractTableModel):
+    """
+    Table model over a ScanResults; cells are formatted on request, so only
+    visible rows cost anything. Rows arrive per batch via append_batch.
+    """
+    
+    HEADERS = (
+        "📄 Name", "📁 Path", "🔢 Mode", "🔣 Symbolic",
+        "⚠️ Risk", "🎯 Expected", "📊 Size", "📅 Modified"
+    )
+    
+    # Perataan per kolom; tidak ada state per baris.
+    ALIGNMENTS = (
+        None, None, None, None,
+        Qt.AlignmentFlag.AlignCenter, None,
+        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, None
+    )
+    
+    def __init__(self, results, parent=None):
+        super().__init__(parent)
+        self._results = results
+        self._risk_font = RiskTableWidgetItem.risk_font()
+        self._risk_brushes = tuple(RiskTableWidgetItem.BRUSHES[level] for level in RISK_LEVELS)
+    
+    def results(self):
+        """ScanResults di balik model (kolom risks/relatives dll. dibaca langsung oleh proxy)."""
+        return self._results
+    
+    def set_results(self, results):
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+    
+    def append_batch(self, batch: list):
+        if not batch:
+            return
+        first = len(self._results)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._results.extend(batch)
+        self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._results)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        results = self._results
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return results.names[row]
+            if column == 1:
+                return results.relatives[row]
+            if column == 2:
+                return format_mode(results.modes[row])
+            if column == 3:
+                return stat.filemode(results.modes[row])
+            if column == 4:
+                return RISK_LEVELS[results.risks[row]]
+            if column == 5:
+                return results.expected[row] or '-'
+            if column == 6:
+                return format_size(results.sizes[row])
+            return datetime.fromtimestamp(results.mtimes[row]).strftime('%Y-%m-%d %H:%M')
+        
+        if role == SORT_ROLE:
+            if column == 2:
+                return results.modes[row] & 0o777
+            if column == 4:
+                return results.risks[row]
+            if column == 6:
+                return results.sizes[row]
+            if column == 7:
+                return results.mtimes[row]
+            return self.data(index)
         
-        font = QFont('Segoe UI', 10)
-        font.setBold(True)
-        self.setFont(font)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self.ALIGNMENTS[column]
+        
+        if column == 4:
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._risk_brushes[results.risks[row]][0]
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._risk_brushes[results.risks[row]][1]
+            if role == Qt.ItemDataRole.FontRole:
+                return self._risk_font
+        return None
+
+
+class ScanFilterProxyModel(QSortFilterProxyModel):
+    """
+    Risk-level + name/path search filter; sorts on raw values (SORT_ROLE).
+    
+    The source model must provide results() returning a ScanResults.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._risk_code = None
+        self._search = ''
+        self.setSortRole(SORT_ROLE)
+    
+    def set_filter(self, risk_level, search_text: str):
+        self._risk_code = RISK_CODES.get(risk_level)
+        self._search = search_text.lower()
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        results = self.sourceModel().results()
+        if self._risk_code is not None and results.risks[source_row] != self._risk_code:
+            return False
+        # name is the last component of relative, so one check covers both.
+        return not self._search or self._search in results.relatives[source_row].lower()
 
 
 class StatCard(GlassCard):
@@ -577,15 +728,197 @@ class ModernLineEdit(QWidget):
         self.line_edit.setEchoMode(mode)
 
 
+class PermissionBitGrid(QWidget):
+    """
+    rwx grid for owner/group/others painted as one widget.
+    
+    State is the 9 permission bits (0o000-0o777). Clicking a cell, or Space
+    on the focused cell (moved with the arrow keys), flips its bit and emits
+    bitsChanged; setBits does not emit.
+    """
+    
+    bitsChanged = pyqtSignal(int)
+    
+    COLUMNS = (("Read", QColor(74, 222, 128)), ("Write", QColor(251, 191, 36)), ("Execute", QColor(248, 113, 113)))
+    ROWS = ("Owner", "Group", "Others")
+    
+    LABEL_WIDTH = 72
+    HEADER_HEIGHT = 28
+    COLUMN_WIDTH = 80
+    ROW_HEIGHT = 34
+    CELL = 18
+    
+    def __init__(self, bits: int = 0o644, parent=None):
+        super().__init__(parent)
+        self._bits = bits & 0o777
+        self._checked_brush = QBrush(QColor(82, 82, 82))
+        self._unchecked_brush = QBrush(QColor(26, 26, 26))
+        self._border_pen = QPen(QColor(64, 64, 64))
+        self._mark_pen = QPen(QColor(229, 229, 229), 2)
+        self._label_pen = QPen(QColor(212, 212, 212))
+        self._header_font = QFont()
+        self._header_font.setWeight(QFont.Weight.Medium)
+        self._focus_pen = QPen(QColor(229, 229, 229), 1, Qt.PenStyle.DotLine)
+        self._current = 0
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setAccessibleName("Permission bits")
+        self.setFixedSize(self.sizeHint())
+    
+    def sizeHint(self):
+        return QSize(self.LABEL_WIDTH + 3 * self.COLUMN_WIDTH, self.HEADER_HEIGHT + 3 * self.ROW_HEIGHT)
+    
+    def bits(self) -> int:
+        return self._bits
+    
+    def setBits(self, bits: int):
+        bits &= 0o777
+        if bits != self._bits:
+            self._bits = bits
+            self.update()
+    
+    def _cell_rect(self, row: int, column: int) -> QRect:
+        x = self.LABEL_WIDTH + column * self.COLUMN_WIDTH + (self.COLUMN_WIDTH - self.CELL) // 2
+        y = self.HEADER_HEIGHT + row * self.ROW_HEIGHT + (self.ROW_HEIGHT - self.CELL) // 2
+        return QRect(x, y, self.CELL, self.CELL)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._header_font)
+        
+        for column, (title, color) in enumerate(self.COLUMNS):
+            painter.setPen(color)
+            painter.drawText(QRect(self.LABEL_WIDTH + column * self.COLUMN_WIDTH, 0,
+                                   self.COLUMN_WIDTH, self.HEADER_HEIGHT),
+                             Qt.AlignmentFlag.AlignCenter, title)
+        
+        for row, title in enumerate(self.ROWS):
+            painter.setPen(self._label_pen)
+            painter.drawText(QRect(0, self.HEADER_HEIGHT + row * self.ROW_HEIGHT,
+                                   self.LABEL_WIDTH, self.ROW_HEIGHT),
+                             Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, title)
+            for column in range(3):
+                checked = self._bits & (0o400 >> (row * 3 + column))
+                rect = self._cell_rect(row, column)
+                painter.setPen(self._border_pen)
+                painter.setBrush(self._checked_brush if checked else self._unchecked_brush)
+                painter.drawRoundedRect(rect, 4, 4)
+                if checked:
+                    painter.setPen(self._mark_pen)
+                    painter.drawLine(rect.left() + 4, rect.center().y(), rect.center().x() - 1, rect.bottom() - 4)
+                    painter.drawLine(rect.center().x() - 1, rect.bottom() - 4, rect.right() - 3, rect.top() + 4)
+        
+        if self.hasFocus():
+            painter.setPen(self._focus_pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(self._cell_rect(*divmod(self._current, 3)).adjusted(-3, -3, 3, 3), 6, 6)
+    
+    def _toggle(self, index: int):
+        self._current = index
+        self._bits ^= 0o400 >> index
+        self.update()
+        self.bitsChanged.emit(self._bits)
+    
+    def keyPressEvent(self, event):
+        key = event.key()
+        row, column = divmod(self._current, 3)
+        if key in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self._toggle(self._current)
+            return
+        if key == Qt.Key.Key_Left:
+            column = max(column - 1, 0)
+        elif key == Qt.Key.Key_Right:
+            column = min(column + 1, 2)
+        elif key == Qt.Key.Key_Up:
+            row = max(row - 1, 0)
+        elif key == Qt.Key.Key_Down:
+            row = min(row + 1, 2)
+        else:
+            return super().keyPressEvent(event)
+        self._current = row * 3 + column
+        self.update()
+    
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        self.update()
+    
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)
+        self.update()
+    
+    def mousePressEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return super().mousePressEvent(event)
+        pos = event.position().toPoint()
+        column = (pos.x() - self.LABEL_WIDTH) // self.COLUMN_WIDTH
+        row = (pos.y() - self.HEADER_HEIGHT) // self.ROW_HEIGHT
+        if pos.x() < self.LABEL_WIDTH or pos.y() < self.HEADER_HEIGHT or not (0 <= row < 3 and 0 <= column < 3):
+            return
+        self._toggle(row * 3 + column)
+
+
+class StaticTextLabel(QLabel):
+    """
+    QLabel for short values that change often (e.g. "rwxr-xr-x").
+    
+    Each distinct string is laid out once as a QStaticText and reused, so
+    setText only schedules a repaint. Styling (background, padding, font,
+    color) still comes from the stylesheet.
+    """
+    
+    _static_cache = {}
+    
+    def __init__(self, text: str = "", widest: str = "", parent=None):
+        super().__init__(parent)
+        self._text = text
+        # Lebar tetap dari nilai terlebar, agar layout tidak dihitung ulang tiap update.
+        self._widest = widest or text
+    
+    def text(self) -> str:
+        return self._text
+    
+    def setText(self, text: str):
+        if text != self._text:
+            self._text = text
+            self.update()
+    
+    def sizeHint(self):
+        margins = self.contentsMargins()
+        metrics = self.fontMetrics()
+        return QSize(metrics.horizontalAdvance(self._widest) + margins.left() + margins.right(),
+                     metrics.height() + margins.top() + margins.bottom())
+    
+    def minimumSizeHint(self):
+        return self.sizeHint()
+    
+    def paintEvent(self, event):
+        # Teks QLabel sendiri kosong: super() hanya melukis latar dari stylesheet.
+        super().paintEvent(event)
+        static = self._static_cache.get(self._text)
+        if static is None:
+            static = self._static_cache[self._text] = QStaticText(self._text)
+        rect = self.contentsRect()
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(QPoint(rect.left(), rect.top() + (rect.height() - self.fontMetrics().height()) // 2), static)
+
+
 __all__ = [
     'GlassCard',
     'ModernButton', 
     'AnimatedProgressBar',
     'PillBadge',
     'ModernTableWidget',
+    'ModernTableView',
+    'ScanResultsModel',
+    'ScanFilterProxyModel',
     'RiskTableWidgetItem',
     'StatCard',
     'ToastNotification',
     'LoadingSpinner',
-    'ModernLineEdit'
+    'ModernLineEdit',
+    'PermissionBitGrid',
+    'StaticTextLabel'
 ]
@@ -11,16 +11,21 @@
 ╚══════════════════════════════════════════════════════════════════╝"""
 
 import os
+import stat
 import hashlib
 from datetime import datetime
 from typing import Dict, Any
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
 def format_size(size_bytes: int) -> str:
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    unit = (int(size_bytes).bit_length() - 1) // 10
+    if unit > 4:
+        unit = 4
+    return f"{size_bytes / _SIZE_DIVISORS[unit]:.2f} {_SIZE_UNITS[unit]}"
 
 def get_file_hash(filepath: str) -> str:
     sha256_hash = hashlib.sha256()
@@ -35,6 +40,19 @@ def get_file_hash(filepath: str) -> str:
 def format_timestamp(timestamp: datetime) -> str:
     return timestamp.strftime('%Y-%m-%d %H:%M:%S')
 
+_MODE_OCTAL = tuple(f"{mode:03o}" for mode in range(0o1000))
+
+def format_mode(st_mode: int) -> str:
+    return _MODE_OCTAL[st_mode & 0o777]
+
+def expand_file_info(info: Dict) -> Dict[str, Any]:
+    """Readable mode/symbolic/modified for a scan record's raw stat fields."""
+    return {
+        'mode': format_mode(info['st_mode']),
+        'symbolic': stat.filemode(info['st_mode']),
+        'modified': datetime.fromtimestamp(info['mtime']),
+    }
+
 def safe_chmod(filepath: str, mode: int) -> bool:
     try:
         os.chmod(filepath, mode)